@@ -1,14 +1,53 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import re
 import time
 from email_scraper import EmailScraper
-from email_validator import EmailValidator
-from utils import export_to_csv, rate_limiter
+from email_validator import EmailValidator, resolve_mx_bulk
+from utils import export_to_csv, Throttle
 from sendgrid_client import EmailCampaignManager, AutoReplyManager
 from email_templates import EmailTemplates
 import os
+import io
 import json
+import gc
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import compress
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
+
+# Email finder shared by every scraper instance; ASCII mode skips Unicode-aware matching
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", re.ASCII)
+
+# Loose shape check applied to campaign recipients before sending
+RECIPIENT_PATTERN = r'[^@\s]+@[^@\s]+\.[^@\s]+'
+
+# Session state entries derived from the email lists; dropped whenever the lists are cleared
+DERIVED_STATE_KEYS = ('_valid_mask', '_valid_mask_key', '_emails_df', '_emails_df_key', '_export_cache',
+                      '_results_frame', '_results_frame_key', '_validated_index', '_validated_index_key')
+
+# Typed columns of the results table: Arrow strings and (nullable) booleans instead of object columns
+RESULT_COLUMN_DTYPES = {
+    'email': 'string[pyarrow]',
+    'is_valid': 'bool',
+    'format_valid': 'bool',
+    'blacklist_check': 'boolean',
+    'dns_valid': 'boolean',
+    'smtp_valid': 'boolean',
+    'error_message': 'string[pyarrow]',
+}
+
+# Download extension and MIME type per export format
+EXPORT_FILE_TYPES = {
+    "CSV": ("csv", "text/csv"),
+    "Excel (XLSX)": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "JSON": ("json", "application/json"),
+}
 
 # Page configuration
 st.set_page_config(
@@ -18,6 +57,102 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def get_campaign_manager():
+    """Shared SendGrid campaign manager, reused across campaigns and reruns."""
+    return EmailCampaignManager()
+
+@st.cache_resource
+def get_auto_reply_manager():
+    """Shared follow-up manager, bound to the shared campaign manager."""
+    return AutoReplyManager(get_campaign_manager())
+
+@st.cache_resource
+def get_scraper(delay, max_pages, max_concurrent=1):
+    """Shared scraper per configuration, so its HTTP session survives reruns."""
+    return EmailScraper(delay=delay, max_pages=max_pages, pattern=EMAIL_RE, max_concurrent=max_concurrent)
+
+@st.cache_resource
+def get_validator(enable_smtp, timeout):
+    """Shared validator per configuration, so its DNS resolver and TTL-honouring answer cache survive reruns."""
+    return EmailValidator(enable_smtp=enable_smtp, timeout=timeout)
+
+def validate_stream(emails, validate, executor):
+    """Yield (index, result) pairs as validations finish, so fast failures never wait on slow SMTP probes."""
+    futures = {executor.submit(validate, email): i for i, email in enumerate(emails)}
+    for future in as_completed(futures):
+        yield futures[future], future.result()
+
+def domain_series(emails):
+    """Domain part of each email (NA when there is no '@'), in one vectorized pass."""
+    parts = emails.str.split('@', n=1, expand=True)
+    if 1 not in parts.columns:
+        return pd.Series(pd.NA, index=emails.index, dtype=emails.dtype)
+    return parts[1]
+
+def bump_version(name):
+    """Record that a session list was replaced or changed in place, invalidating caches derived from it."""
+    st.session_state[f'{name}_version'] = st.session_state.get(f'{name}_version', 0) + 1
+
+def data_version(name):
+    """Change counter of a session list; derived caches key on it, since list ids are reused once freed."""
+    return st.session_state.get(f'{name}_version', 0)
+
+def scraped_emails_frame():
+    """Email/domain frame for the scraped list, rebuilt only when the list changes."""
+    emails = st.session_state.scraped_emails
+    key = data_version('scraped_emails')
+    if st.session_state.get('_emails_df_key') != key:
+        df = pd.DataFrame({'email': pd.Series(emails, dtype='string[pyarrow]')})
+        df['domain'] = domain_series(df['email'])
+        st.session_state._emails_df = df
+        st.session_state._emails_df_key = key
+    return st.session_state._emails_df
+
+def valid_mask(validated):
+    """Boolean is_valid array for the validated list, rebuilt only when the list changes."""
+    key = data_version('validated_emails')
+    if st.session_state.get('_valid_mask_key') != key:
+        st.session_state._valid_mask = np.fromiter(
+            map(itemgetter('is_valid'), validated), dtype=bool, count=len(validated)
+        )
+        st.session_state._valid_mask_key = key
+    return st.session_state._valid_mask
+
+def validated_index(validated):
+    """Email -> result lookup for the validated list, rebuilt only when the list changes."""
+    key = data_version('validated_emails')
+    if st.session_state.get('_validated_index_key') != key:
+        st.session_state._validated_index = {r['email']: r for r in validated}
+        st.session_state._validated_index_key = key
+    return st.session_state._validated_index
+
+def validated_results_frame(validated):
+    """Results frame and sorted domain list, rebuilt only when the validated list changes."""
+    key = data_version('validated_emails')
+    if st.session_state.get('_results_frame_key') != key:
+        # Build the table column by column, so each field lands in one contiguous typed array
+        df_results = pd.DataFrame({
+            column: pd.Series([r.get(column) for r in validated], dtype=dtype)
+            for column, dtype in RESULT_COLUMN_DTYPES.items()
+        })
+        df_results['domain'] = domain_series(df_results['email'])
+        result_domains = sorted(df_results['domain'].dropna().unique().tolist())
+        
+        # Add status indicators
+        df_results['Status'] = np.where(df_results['is_valid'].to_numpy(dtype=bool), "✅ Valid", "❌ Invalid")
+        st.session_state._results_frame = (df_results, result_domains)
+        st.session_state._results_frame_key = key
+    return st.session_state._results_frame
+
+def cached_export(name, key, build):
+    """Export payload kept in session state until its key (results + options) changes."""
+    cache = st.session_state.setdefault('_export_cache', {})
+    entry = cache.get(name)
+    if entry is None or entry[0] != key:
+        entry = cache[name] = (key, build())
+    return entry[1]
+
 # Initialize session state
 if 'scraped_emails' not in st.session_state:
     st.session_state.scraped_emails = []
@@ -33,6 +168,281 @@ if 'scheduled_followups' not in st.session_state:
     st.session_state.scheduled_followups = {}
 if 'email_templates' not in st.session_state:
     st.session_state.email_templates = EmailTemplates.get_all_templates()
+if '_template_keys' not in st.session_state:
+    # Refreshed only when a template is saved, so reruns don't rebuild it
+    st.session_state._template_keys = list(st.session_state.email_templates)
+
+@st.fragment
+def results_fragment(validated):
+    """Results & Export tab; its filters and exports rerun only this fragment, not the whole app."""
+    st.header("Validation Results & Export")
+    
+    if validated:
+        # Summary statistics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        df_results, result_domains = validated_results_frame(validated)
+        is_valid = valid_mask(validated)
+        
+        # One column-wise reduction for all three counts
+        counts = df_results[['is_valid', 'format_valid', 'dns_valid']].sum()
+        total_emails = len(validated)
+        valid_emails = int(counts['is_valid'])
+        format_valid = int(counts['format_valid'])
+        dns_valid = int(counts['dns_valid'])
+        
+        col1.metric("Total Emails", total_emails)
+        col2.metric("Valid Emails", valid_emails, f"{(valid_emails/total_emails)*100:.1f}%")
+        col3.metric("Format Valid", format_valid)
+        col4.metric("DNS Valid", dns_valid)
+        
+        # Results table
+        st.subheader("Detailed Results")
+        
+        # Reorder columns for better display
+        display_columns = ['email', 'domain', 'Status', 'format_valid', 'blacklist_check', 'dns_valid', 'smtp_valid', 'error_message']
+        df_display = df_results[display_columns].copy()
+        
+        # Rename columns for better readability
+        df_display.columns = ['Email', 'Domain', 'Status', 'Format', 'Blacklist', 'DNS', 'SMTP', 'Error']
+        
+        # Filter options
+        col1, col2 = st.columns(2)
+        with col1:
+            status_filter = st.selectbox("Filter by status:", ["All", "Valid only", "Invalid only"])
+        with col2:
+            domain_filter = st.selectbox(
+                "Filter by domain:", 
+                ["All"] + result_domains
+            )
+        
+        # Apply filters
+        filtered_df = df_display.copy()
+        if status_filter == "Valid only":
+            filtered_df = filtered_df[filtered_df['Status'] == "✅ Valid"]
+        elif status_filter == "Invalid only":
+            filtered_df = filtered_df[filtered_df['Status'] == "❌ Invalid"]
+        
+        if domain_filter != "All":
+            filtered_df = filtered_df[filtered_df['Domain'] == domain_filter]
+        
+        st.dataframe(filtered_df, use_container_width=True)
+        
+        # Advanced Analysis
+        st.subheader("📈 Advanced Analysis")
+        
+        # Generate analysis
+        from utils import format_validation_summary, group_emails_by_domain
+        analysis = format_validation_summary(validated, top_domains=10)
+        
+        if analysis:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.write("**Validation Summary**")
+                st.metric("Success Rate", f"{analysis['valid_percentage']:.1f}%")
+                st.metric("Format Valid", f"{analysis['format_valid']}/{analysis['total_emails']}")
+                st.metric("DNS Valid", f"{analysis['dns_valid']}/{analysis['total_emails']}")
+                st.metric("SMTP Valid", f"{analysis['smtp_valid']}/{analysis['total_emails']}")
+            
+            with col2:
+                st.write("**Top Domains**")
+                domain_df = pd.DataFrame(analysis['top_domains'][:5], columns=['Domain', 'Count'])
+                st.dataframe(domain_df, hide_index=True)
+                
+                st.metric("Unique Domains", analysis['unique_domains'])
+            
+            # Error analysis
+            if analysis['error_types']:
+                st.write("**Common Error Types**")
+                error_df = pd.DataFrame(list(analysis['error_types'].items()), columns=['Error Type', 'Count'])
+                error_df = error_df.sort_values('Count', ascending=False)
+                st.dataframe(error_df, hide_index=True)
+        
+        st.divider()
+        
+        # Bulk Export Options
+        st.subheader("📦 Bulk Export Options")
+        
+        # Export format selection
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            export_format = st.selectbox(
+                "Export format:",
+                ["CSV", "Excel (XLSX)", "JSON"],
+                help="Choose the format for your exported data"
+            )
+            
+            export_scope = st.selectbox(
+                "Export scope:",
+                ["All results", "Valid emails only", "Invalid emails only", "By domain"],
+                help="Choose which emails to include in export"
+            )
+        
+        with col2:
+            selected_domains = []
+            pretty_json = False
+            
+            if export_scope == "By domain":
+                available_domains = result_domains
+                selected_domains = st.multiselect(
+                    "Select domains to export:",
+                    available_domains,
+                    help="Choose specific domains to export"
+                )
+            
+            include_details = st.checkbox(
+                "Include validation details",
+                value=True,
+                help="Include detailed validation information in export"
+            )
+            
+            if export_format == "JSON":
+                pretty_json = st.checkbox(
+                    "Pretty-print JSON",
+                    value=False,
+                    help="Indent the JSON output (larger and slower for big exports)"
+                )
+        
+        # File name parts shared by every download button
+        scope_slug = export_scope.lower().replace(' ', '_')
+        timestamp = int(time.time())
+        
+        # Export buttons
+        col1, col2, col3, col4 = st.columns(4)
+        
+        # Payloads are rebuilt only when the results or export options change
+        results_key = data_version('validated_emails')
+        
+        with col1:
+            def build_results_export():
+                # Filter data based on scope
+                if export_scope == "Valid emails only":
+                    export_data = list(compress(validated, is_valid))
+                elif export_scope == "Invalid emails only":
+                    export_data = list(compress(validated, ~is_valid))
+                elif export_scope == "By domain":
+                    # Match on the same domain column the options were built from
+                    export_data = list(compress(validated, df_results['domain'].isin(selected_domains)))
+                else:
+                    export_data = validated
+                
+                if not export_data:
+                    return None
+                
+                if export_format == "CSV":
+                    return export_to_csv(export_data).encode('utf-8')
+                
+                if export_format == "Excel (XLSX)":
+                    # Create Excel file
+                    output = io.BytesIO()
+                    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+                        export_df = pd.DataFrame(export_data)
+                        export_df.to_excel(writer, sheet_name='Validation Results', index=False)
+                        
+                        # Add summary sheet
+                        if analysis:
+                            summary_data = {
+                                'Metric': ['Total Emails', 'Valid Emails', 'Success Rate', 'Unique Domains'],
+                                'Value': [analysis['total_emails'], analysis['valid_emails'], 
+                                        f"{analysis['valid_percentage']:.1f}%", analysis['unique_domains']]
+                            }
+                            summary_df = pd.DataFrame(summary_data)
+                            summary_df.to_excel(writer, sheet_name='Summary', index=False)
+                    return output.getvalue()
+                
+                if orjson is not None:
+                    return orjson.dumps(export_data, option=orjson.OPT_INDENT_2 if pretty_json else 0)
+                return json.dumps(export_data, indent=2 if pretty_json else None)
+            
+            export_payload = cached_export(
+                'results',
+                (results_key, export_scope, tuple(selected_domains), export_format, pretty_json),
+                build_results_export
+            )
+            
+            if export_payload is not None:
+                extension, mime = EXPORT_FILE_TYPES[export_format]
+                st.download_button(
+                    label="📥 Export Results",
+                    data=export_payload,
+                    file_name=f"email_validation_{scope_slug}_{timestamp}.{extension}",
+                    mime=mime
+                )
+            else:
+                st.warning("No data to export with current filters.")
+        
+        with col2:
+            def build_email_list():
+                # Simple email list export
+                get_email = itemgetter('email')
+                if export_scope == "Valid emails only":
+                    email_list = list(map(get_email, compress(validated, is_valid)))
+                elif export_scope == "Invalid emails only":
+                    email_list = list(map(get_email, compress(validated, ~is_valid)))
+                else:
+                    email_list = list(map(get_email, validated))
+                
+                return '\n'.join(email_list) if email_list else None
+            
+            email_text = cached_export('email_list', (results_key, export_scope), build_email_list)
+            
+            if email_text is not None:
+                st.download_button(
+                    label="📧 Export Email List",
+                    data=email_text,
+                    file_name=f"email_list_{scope_slug}_{timestamp}.txt",
+                    mime="text/plain"
+                )
+            else:
+                st.warning("No emails to export.")
+        
+        with col3:
+            if st.button("📊 Export Analytics"):
+                if analysis:
+                    # Create analytics CSV
+                    analytics_data = []
+                    analytics_data.append(['Metric', 'Value'])
+                    analytics_data.append(['Total Emails', analysis['total_emails']])
+                    analytics_data.append(['Valid Emails', analysis['valid_emails']])
+                    analytics_data.append(['Success Rate (%)', f"{analysis['valid_percentage']:.1f}"])
+                    analytics_data.append(['Format Valid', analysis['format_valid']])
+                    analytics_data.append(['DNS Valid', analysis['dns_valid']])
+                    analytics_data.append(['SMTP Valid', analysis['smtp_valid']])
+                    analytics_data.append(['Unique Domains', analysis['unique_domains']])
+                    analytics_data.append(['', ''])
+                    analytics_data.append(['Top Domains', 'Count'])
+                    
+                    for domain, count in analysis['top_domains'][:10]:
+                        analytics_data.append([domain, count])
+                    
+                    analytics_csv = '\n'.join([','.join(map(str, row)) for row in analytics_data])
+                    
+                    st.download_button(
+                        label="Download Analytics CSV",
+                        data=analytics_csv,
+                        file_name=f"email_analytics_{timestamp}.csv",
+                        mime="text/csv"
+                    )
+                else:
+                    st.warning("No analytics data available.")
+        
+        with col4:
+            if st.button("🔄 Clear All Data"):
+                # Clear in place and drop derived caches so large runs are freed immediately
+                st.session_state.scraped_emails.clear()
+                validated.clear()
+                bump_version('scraped_emails')
+                bump_version('validated_emails')
+                for key in DERIVED_STATE_KEYS:
+                    st.session_state.pop(key, None)
+                gc.collect()
+                st.success("All data cleared!")
+                st.rerun()
+    
+    else:
+        st.info("No validation results available. Please validate some emails first.")
 
 def main():
     st.title("📧 Email Scraper & Validator")
@@ -45,7 +455,16 @@ def main():
         # Rate limiting settings
         st.subheader("Rate Limiting")
         delay_between_requests = st.slider("Delay between requests (seconds)", 1, 10, 2)
+        validation_workers = st.slider(
+            "Parallel validations", 1, 50, 10,
+            help="Emails validated at the same time; DNS and SMTP checks mostly wait on the network"
+        )
         max_pages = st.number_input("Maximum pages to scrape", min_value=1, max_value=50, value=5)
+        parallel_fetch = st.checkbox(
+            "Fetch pages in parallel", value=False,
+            help="Fetch contact and social pages concurrently; each site still gets one request per delay"
+        )
+        scrape_concurrency = 4 if parallel_fetch else 1
         
         # Validation settings
         st.subheader("Validation Settings")
@@ -78,7 +497,7 @@ def main():
             st.write("**Scraping Statistics**")
             if st.session_state.scraped_emails:
                 st.metric("Total Emails Found", len(st.session_state.scraped_emails))
-                unique_domains = len(set([email.split('@')[1] for email in st.session_state.scraped_emails if '@' in email]))
+                unique_domains = scraped_emails_frame()['domain'].nunique()
                 st.metric("Unique Domains", unique_domains)
         
         if st.button("🚀 Start Scraping", disabled=st.session_state.scraping_in_progress):
@@ -87,19 +506,20 @@ def main():
                 
                 with st.spinner("Scraping emails from website..."):
                     try:
-                        scraper = EmailScraper(delay=delay_between_requests, max_pages=max_pages)
+                        scraper = get_scraper(delay_between_requests, max_pages, scrape_concurrency)
                         emails = scraper.scrape_website(url_input, scrape_options)
                         
                         if emails:
-                            st.session_state.scraped_emails = list(set(emails))  # Remove duplicates
+                            st.session_state.scraped_emails = list(emails)  # Already unique
+                            bump_version('scraped_emails')
                             st.success(f"✅ Found {len(st.session_state.scraped_emails)} unique email addresses!")
                             
                             # Display preview
                             st.subheader("Found Emails Preview:")
+                            preview = scraped_emails_frame().head(10)
                             preview_df = pd.DataFrame({
-                                'Email': st.session_state.scraped_emails[:10],
-                                'Domain': [email.split('@')[1] if '@' in email else 'Invalid' 
-                                          for email in st.session_state.scraped_emails[:10]]
+                                'Email': preview['email'],
+                                'Domain': preview['domain'].fillna('Invalid')
                             })
                             st.dataframe(preview_df, use_container_width=True)
                             
@@ -202,18 +622,18 @@ def main():
                     status_text = st.empty()
                     results_container = st.empty()
                     
-                    all_bulk_emails = []
+                    all_bulk_emails = set()
                     processed_count = 0
                     
                     try:
-                        scraper = EmailScraper(delay=delay_between_requests, max_pages=3)  # Limit pages for bulk
+                        scraper = get_scraper(delay_between_requests, 3, scrape_concurrency)  # Limit pages for bulk
                         
                         for i, url in enumerate(url_list):
                             status_text.text(f"Processing {i+1}/{len(url_list)}: {url}")
                             
                             try:
                                 emails = scraper.scrape_website(url, bulk_scrape_options)
-                                all_bulk_emails.extend(emails)
+                                all_bulk_emails.update(emails)
                                 processed_count += 1
                                 
                                 # Update progress
@@ -222,7 +642,7 @@ def main():
                                 # Show interim results
                                 with results_container.container():
                                     st.write(f"**Progress:** {processed_count}/{len(url_list)} URLs processed")
-                                    st.write(f"**Total Emails Found:** {len(set(all_bulk_emails))}")
+                                    st.write(f"**Total Emails Found:** {len(all_bulk_emails)}")
                                     
                             except Exception as e:
                                 st.warning(f"Failed to scrape {url}: {str(e)}")
@@ -231,16 +651,17 @@ def main():
                             if i < len(url_list) - 1:
                                 time.sleep(delay_between_requests)
                         
-                        # Remove duplicates and update session
-                        unique_emails = list(set(all_bulk_emails))
+                        # Update session (the set already removed duplicates)
+                        unique_emails = list(all_bulk_emails)
                         st.session_state.scraped_emails = unique_emails
+                        bump_version('scraped_emails')
                         
                         st.success(f"✅ Bulk scraping completed! Found {len(unique_emails)} unique emails from {processed_count} websites.")
                         
                         # Show summary
                         if unique_emails:
-                            domains = set([email.split('@')[1] for email in unique_emails if '@' in email])
-                            st.info(f"📊 Summary: {len(unique_emails)} emails from {len(domains)} different domains")
+                            domain_count = scraped_emails_frame()['domain'].nunique()
+                            st.info(f"📊 Summary: {len(unique_emails)} emails from {domain_count} different domains")
                             
                     except Exception as e:
                         st.error(f"Bulk scraping error: {str(e)}")
@@ -298,10 +719,15 @@ def main():
                 
                 if uploaded_emails_file is not None:
                     try:
-                        df_emails = pd.read_csv(uploaded_emails_file)
+                        # Only parse the email column, as Arrow-backed strings
+                        df_emails = pd.read_csv(
+                            uploaded_emails_file,
+                            usecols=lambda column: column == 'email',
+                            dtype={'email': 'string[pyarrow]'}
+                        )
                         if 'email' in df_emails.columns:
-                            email_list = df_emails['email'].dropna().astype(str).tolist()
-                            email_list = [email.strip() for email in email_list if '@' in email]
+                            emails = df_emails['email'].dropna().str.strip()
+                            email_list = emails[emails.str.contains('@', regex=False)].tolist()
                         else:
                             st.error("CSV file must contain an 'email' column.")
                         
@@ -343,9 +769,11 @@ def main():
                         existing_emails = set(st.session_state.scraped_emails)
                         new_emails = [email for email in cleaned_emails if email not in existing_emails]
                         st.session_state.scraped_emails.extend(new_emails)
+                        bump_version('scraped_emails')
                         st.success(f"✅ Added {len(new_emails)} new emails! Total: {len(st.session_state.scraped_emails)}")
                     else:
                         st.session_state.scraped_emails = cleaned_emails
+                        bump_version('scraped_emails')
                         st.success(f"✅ Imported {len(cleaned_emails)} emails!")
                     
                     st.rerun()
@@ -382,9 +810,16 @@ def main():
             
             if uploaded_file is not None:
                 try:
-                    df = pd.read_csv(uploaded_file)
+                    # Only parse the email column, as Arrow-backed strings
+                    df = pd.read_csv(
+                        uploaded_file,
+                        usecols=lambda column: column == 'email',
+                        dtype={'email': 'string[pyarrow]'}
+                    )
                     if 'email' in df.columns:
-                        st.session_state.scraped_emails = df['email'].dropna().tolist()
+                        # unique() also drops duplicate rows in the same pass
+                        st.session_state.scraped_emails = df['email'].dropna().unique().tolist()
+                        bump_version('scraped_emails')
                         st.success(f"Loaded {len(st.session_state.scraped_emails)} emails from file!")
                     else:
                         st.error("CSV file must contain an 'email' column.")
@@ -462,7 +897,7 @@ def main():
             
             with col3:
                 if st.session_state.validated_emails:
-                    valid_count = len([r for r in st.session_state.validated_emails if r['is_valid']])
+                    valid_count = int(valid_mask(st.session_state.validated_emails).sum())
                     st.metric("Valid Emails", f"{valid_count}/{len(st.session_state.validated_emails)}")
             
             # Main validation button
@@ -477,73 +912,107 @@ def main():
                 try:
                     # Configure validator based on mode
                     if validation_mode == "Format only":
-                        validator = EmailValidator(enable_smtp=False, timeout=timeout_seconds)
+                        validator = get_validator(False, timeout_seconds)
                     elif validation_mode == "Quick (format + DNS only)":
-                        validator = EmailValidator(enable_smtp=False, timeout=timeout_seconds)
+                        validator = get_validator(False, timeout_seconds)
                     else:
-                        validator = EmailValidator(enable_smtp=enable_smtp_check, timeout=timeout_seconds)
+                        validator = get_validator(enable_smtp_check, timeout_seconds)
                     
                     # Determine which emails to validate
                     if continue_validation and st.session_state.validated_emails:
-                        validated_emails_set = set([r['email'] for r in st.session_state.validated_emails])
+                        # Only the delta is validated; new results are appended to the existing list
+                        validated_results = st.session_state.validated_emails
+                        already_validated = validated_index(validated_results)
                         emails_to_validate = [email for email in st.session_state.scraped_emails 
-                                            if email not in validated_emails_set]
-                        validated_results = st.session_state.validated_emails.copy()
+                                            if email not in already_validated]
                     else:
                         emails_to_validate = st.session_state.scraped_emails.copy()
                         validated_results = []
+                        already_validated = {}
+                    
+                    # Group emails by domain so cached MX answers and pooled SMTP connections are reused back to back
+                    emails_to_validate.sort(key=lambda email: email.rpartition('@')[2].lower())
+                    
+                    # Results are published as each batch finishes, so an interrupted run keeps its progress
+                    st.session_state.validated_emails = validated_results
+                    bump_version('validated_emails')
                     
                     total_emails = len(emails_to_validate)
                     processed_count = 0
+                    checked_before = len(validated_results)
+                    valid_so_far = len([r for r in validated_results if r['is_valid']])
                     
-                    # Process in batches
-                    for batch_start in range(0, total_emails, batch_size):
-                        batch_end = min(batch_start + batch_size, total_emails)
-                        batch_emails = emails_to_validate[batch_start:batch_end]
+                    # One request slot per interval, shared by all workers
+                    throttle = Throttle(max(0.1, delay_between_requests / 10))
+                    
+                    def validate_one(email):
+                        # Quick validation for format-only mode
+                        if validation_mode == "Format only":
+                            format_valid = validator.validate_format(email)
+                            return {
+                                'email': email,
+                                'is_valid': format_valid,
+                                'format_valid': format_valid,
+                                'blacklist_check': True,
+                                'dns_valid': None,
+                                'smtp_valid': None,
+                                'error_message': None if format_valid else 'Invalid format'
+                            }
                         
-                        status_text.text(f"Processing batch {batch_start//batch_size + 1}: emails {batch_start + 1}-{batch_end}")
+                        throttle.wait()
+                        return validator.validate_email(email)
+                    
+                    with ThreadPoolExecutor(max_workers=validation_workers) as executor:
+                        # Resolve each distinct domain once up front instead of once per email
+                        if validation_mode != "Format only":
+                            normalized = [email.strip().lower() for email in emails_to_validate]
+                            domains = {email.rpartition('@')[2]
+                                       for email, ok in zip(normalized, validator.validate_format_bulk(normalized)) if ok}
+                            status_text.text(f"Resolving MX records for {len(domains)} domains...")
+                            # One event loop on this thread; answers land in the validator's resolver cache
+                            resolve_mx_bulk(list(domains), validator.resolver)
                         
-                        for i, email in enumerate(batch_emails):
-                            global_index = batch_start + i
-                            status_text.text(f"Validating {global_index + 1}/{total_emails}: {email}")
+                        # Process in batches
+                        for batch_start in range(0, total_emails, batch_size):
+                            batch_end = min(batch_start + batch_size, total_emails)
+                            batch_emails = emails_to_validate[batch_start:batch_end]
                             
-                            # Quick validation for format-only mode
-                            if validation_mode == "Format only":
-                                result = {
-                                    'email': email,
-                                    'is_valid': validator.validate_format(email),
-                                    'format_valid': validator.validate_format(email),
-                                    'blacklist_check': True,
-                                    'dns_valid': None,
-                                    'smtp_valid': None,
-                                    'error_message': None if validator.validate_format(email) else 'Invalid format'
-                                }
-                            else:
-                                result = validator.validate_email(email)
+                            status_text.text(f"Processing batch {batch_start//batch_size + 1}: emails {batch_start + 1}-{batch_end}")
+                            
+                            # Results land in input order even though they complete out of order
+                            batch_results = [None] * len(batch_emails)
                             
-                            validated_results.append(result)
-                            processed_count += 1
+                            for i, result in validate_stream(batch_emails, validate_one, executor):
+                                batch_results[i] = result
+                                processed_count += 1
+                                if result['is_valid']:
+                                    valid_so_far += 1
+                                
+                                status_text.text(f"Validated {processed_count}/{total_emails}: {batch_emails[i]}")
+                                
+                                # Update progress
+                                progress_bar.progress(processed_count / total_emails)
+                                
+                                # Show interim results every 10 emails
+                                if processed_count % 10 == 0 or processed_count == total_emails:
+                                    with results_container.container():
+                                        st.write(f"**Progress:** {processed_count}/{total_emails} validated")
+                                        st.write(f"**Valid emails so far:** {valid_so_far}")
+                                        st.write(f"**Success rate:** {(valid_so_far/(checked_before + processed_count)*100):.1f}%")
                             
-                            # Update progress
-                            progress_bar.progress(processed_count / total_emails)
+                            validated_results.extend(batch_results)
+                            bump_version('validated_emails')
                             
-                            # Show interim results every 10 emails
-                            if processed_count % 10 == 0 or processed_count == total_emails:
-                                with results_container.container():
-                                    valid_so_far = len([r for r in validated_results if r['is_valid']])
-                                    st.write(f"**Progress:** {processed_count}/{total_emails} validated")
-                                    st.write(f"**Valid emails so far:** {valid_so_far}")
-                                    st.write(f"**Success rate:** {(valid_so_far/len(validated_results)*100):.1f}%")
+                            # Keep the email index in step with the list instead of rebuilding it
+                            already_validated.update((r['email'], r) for r in batch_results)
+                            st.session_state._validated_index = already_validated
+                            st.session_state._validated_index_key = data_version('validated_emails')
                             
-                            # Rate limiting
-                            if validation_mode != "Format only" and i < len(batch_emails) - 1:
-                                time.sleep(max(0.1, delay_between_requests / 10))  # Faster for bulk
-                        
-                        # Batch completed message
-                        st.info(f"Batch {batch_start//batch_size + 1} completed")
+                            # Batch completed message
+                            st.info(f"Batch {batch_start//batch_size + 1} completed")
                     
-                    # Update session state
-                    st.session_state.validated_emails = validated_results
+                    # The validator outlives the run (cache_resource); quit its idle SMTP connections now
+                    validator.close()
                     
                     # Final summary
                     valid_count = len([r for r in validated_results if r['is_valid']])
@@ -572,256 +1041,7 @@ def main():
     
     # Results & Export Tab
     with tab4:
-        st.header("Validation Results & Export")
-        
-        if st.session_state.validated_emails:
-            # Summary statistics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            total_emails = len(st.session_state.validated_emails)
-            valid_emails = len([r for r in st.session_state.validated_emails if r['is_valid']])
-            format_valid = len([r for r in st.session_state.validated_emails if r['format_valid']])
-            dns_valid = len([r for r in st.session_state.validated_emails if r['dns_valid']])
-            
-            col1.metric("Total Emails", total_emails)
-            col2.metric("Valid Emails", valid_emails, f"{(valid_emails/total_emails)*100:.1f}%")
-            col3.metric("Format Valid", format_valid)
-            col4.metric("DNS Valid", dns_valid)
-            
-            # Results table
-            st.subheader("Detailed Results")
-            
-            # Convert results to DataFrame
-            df_results = pd.DataFrame(st.session_state.validated_emails)
-            
-            # Add status indicators
-            df_results['Status'] = df_results.apply(
-                lambda row: "✅ Valid" if row['is_valid'] else "❌ Invalid", axis=1
-            )
-            
-            # Reorder columns for better display
-            display_columns = ['email', 'Status', 'format_valid', 'blacklist_check', 'dns_valid', 'smtp_valid', 'error_message']
-            df_display = df_results[display_columns].copy()
-            
-            # Rename columns for better readability
-            df_display.columns = ['Email', 'Status', 'Format', 'Blacklist', 'DNS', 'SMTP', 'Error']
-            
-            # Filter options
-            col1, col2 = st.columns(2)
-            with col1:
-                status_filter = st.selectbox("Filter by status:", ["All", "Valid only", "Invalid only"])
-            with col2:
-                domain_filter = st.selectbox(
-                    "Filter by domain:", 
-                    ["All"] + sorted(list(set([email.split('@')[1] for email in df_results['email'] if '@' in email])))
-                )
-            
-            # Apply filters
-            filtered_df = df_display.copy()
-            if status_filter == "Valid only":
-                filtered_df = filtered_df[filtered_df['Status'] == "✅ Valid"]
-            elif status_filter == "Invalid only":
-                filtered_df = filtered_df[filtered_df['Status'] == "❌ Invalid"]
-            
-            if domain_filter != "All":
-                filtered_df = filtered_df[filtered_df['Email'].astype(str).str.contains(f"@{domain_filter}")]
-            
-            st.dataframe(filtered_df, use_container_width=True)
-            
-            # Advanced Analysis
-            st.subheader("📈 Advanced Analysis")
-            
-            # Generate analysis
-            from utils import format_validation_summary, group_emails_by_domain
-            analysis = format_validation_summary(st.session_state.validated_emails)
-            
-            if analysis:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.write("**Validation Summary**")
-                    st.metric("Success Rate", f"{analysis['valid_percentage']:.1f}%")
-                    st.metric("Format Valid", f"{analysis['format_valid']}/{analysis['total_emails']}")
-                    st.metric("DNS Valid", f"{analysis['dns_valid']}/{analysis['total_emails']}")
-                    st.metric("SMTP Valid", f"{analysis['smtp_valid']}/{analysis['total_emails']}")
-                
-                with col2:
-                    st.write("**Top Domains**")
-                    domain_df = pd.DataFrame(analysis['top_domains'][:5], columns=['Domain', 'Count'])
-                    st.dataframe(domain_df, hide_index=True)
-                    
-                    st.metric("Unique Domains", analysis['unique_domains'])
-                
-                # Error analysis
-                if analysis['error_types']:
-                    st.write("**Common Error Types**")
-                    error_df = pd.DataFrame(list(analysis['error_types'].items()), columns=['Error Type', 'Count'])
-                    error_df = error_df.sort_values('Count', ascending=False)
-                    st.dataframe(error_df, hide_index=True)
-            
-            st.divider()
-            
-            # Bulk Export Options
-            st.subheader("📦 Bulk Export Options")
-            
-            # Export format selection
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                export_format = st.selectbox(
-                    "Export format:",
-                    ["CSV", "Excel (XLSX)", "JSON"],
-                    help="Choose the format for your exported data"
-                )
-                
-                export_scope = st.selectbox(
-                    "Export scope:",
-                    ["All results", "Valid emails only", "Invalid emails only", "By domain"],
-                    help="Choose which emails to include in export"
-                )
-            
-            with col2:
-                if export_scope == "By domain":
-                    available_domains = sorted(list(set([email.split('@')[1] for email in df_results['email'] if '@' in email])))
-                    selected_domains = st.multiselect(
-                        "Select domains to export:",
-                        available_domains,
-                        help="Choose specific domains to export"
-                    )
-                
-                include_details = st.checkbox(
-                    "Include validation details",
-                    value=True,
-                    help="Include detailed validation information in export"
-                )
-            
-            # Export buttons
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                if st.button("📥 Export Results"):
-                    # Filter data based on scope
-                    if export_scope == "All results":
-                        export_data = st.session_state.validated_emails
-                    elif export_scope == "Valid emails only":
-                        export_data = [r for r in st.session_state.validated_emails if r['is_valid']]
-                    elif export_scope == "Invalid emails only":
-                        export_data = [r for r in st.session_state.validated_emails if not r['is_valid']]
-                    elif export_scope == "By domain" and 'selected_domains' in locals():
-                        export_data = [r for r in st.session_state.validated_emails 
-                                     if any(domain in r['email'] for domain in selected_domains)]
-                    else:
-                        export_data = st.session_state.validated_emails
-                    
-                    if export_data:
-                        timestamp = int(time.time())
-                        
-                        if export_format == "CSV":
-                            csv_data = export_to_csv(export_data)
-                            st.download_button(
-                                label="Download CSV",
-                                data=csv_data,
-                                file_name=f"email_validation_{export_scope.lower().replace(' ', '_')}_{timestamp}.csv",
-                                mime="text/csv"
-                            )
-                        
-                        elif export_format == "Excel (XLSX)":
-                            # Create Excel file
-                            import io
-                            output = io.BytesIO()
-                            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                                export_df = pd.DataFrame(export_data)
-                                export_df.to_excel(writer, sheet_name='Validation Results', index=False)
-                                
-                                # Add summary sheet
-                                if analysis:
-                                    summary_data = {
-                                        'Metric': ['Total Emails', 'Valid Emails', 'Success Rate', 'Unique Domains'],
-                                        'Value': [analysis['total_emails'], analysis['valid_emails'], 
-                                                f"{analysis['valid_percentage']:.1f}%", analysis['unique_domains']]
-                                    }
-                                    summary_df = pd.DataFrame(summary_data)
-                                    summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                            
-                            st.download_button(
-                                label="Download Excel",
-                                data=output.getvalue(),
-                                file_name=f"email_validation_{export_scope.lower().replace(' ', '_')}_{timestamp}.xlsx",
-                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                            )
-                        
-                        elif export_format == "JSON":
-                            import json
-                            json_data = json.dumps(export_data, indent=2)
-                            st.download_button(
-                                label="Download JSON",
-                                data=json_data,
-                                file_name=f"email_validation_{export_scope.lower().replace(' ', '_')}_{timestamp}.json",
-                                mime="application/json"
-                            )
-                    else:
-                        st.warning("No data to export with current filters.")
-            
-            with col2:
-                if st.button("📧 Export Email List"):
-                    # Simple email list export
-                    if export_scope == "Valid emails only":
-                        email_list = [r['email'] for r in st.session_state.validated_emails if r['is_valid']]
-                    elif export_scope == "Invalid emails only":
-                        email_list = [r['email'] for r in st.session_state.validated_emails if not r['is_valid']]
-                    else:
-                        email_list = [r['email'] for r in st.session_state.validated_emails]
-                    
-                    if email_list:
-                        email_text = '\n'.join(email_list)
-                        st.download_button(
-                            label="Download Email List (TXT)",
-                            data=email_text,
-                            file_name=f"email_list_{export_scope.lower().replace(' ', '_')}_{int(time.time())}.txt",
-                            mime="text/plain"
-                        )
-                    else:
-                        st.warning("No emails to export.")
-            
-            with col3:
-                if st.button("📊 Export Analytics"):
-                    if analysis:
-                        # Create analytics CSV
-                        analytics_data = []
-                        analytics_data.append(['Metric', 'Value'])
-                        analytics_data.append(['Total Emails', analysis['total_emails']])
-                        analytics_data.append(['Valid Emails', analysis['valid_emails']])
-                        analytics_data.append(['Success Rate (%)', f"{analysis['valid_percentage']:.1f}"])
-                        analytics_data.append(['Format Valid', analysis['format_valid']])
-                        analytics_data.append(['DNS Valid', analysis['dns_valid']])
-                        analytics_data.append(['SMTP Valid', analysis['smtp_valid']])
-                        analytics_data.append(['Unique Domains', analysis['unique_domains']])
-                        analytics_data.append(['', ''])
-                        analytics_data.append(['Top Domains', 'Count'])
-                        
-                        for domain, count in analysis['top_domains'][:10]:
-                            analytics_data.append([domain, count])
-                        
-                        analytics_csv = '\n'.join([','.join(map(str, row)) for row in analytics_data])
-                        
-                        st.download_button(
-                            label="Download Analytics CSV",
-                            data=analytics_csv,
-                            file_name=f"email_analytics_{int(time.time())}.csv",
-                            mime="text/csv"
-                        )
-                    else:
-                        st.warning("No analytics data available.")
-            
-            with col4:
-                if st.button("🔄 Clear All Data"):
-                    st.session_state.scraped_emails = []
-                    st.session_state.validated_emails = []
-                    st.success("All data cleared!")
-                    st.rerun()
-        
-        else:
-            st.info("No validation results available. Please validate some emails first.")
+        results_fragment(st.session_state.validated_emails)
     
     # Email Campaigns Tab
     with tab5:
@@ -849,7 +1069,7 @@ def main():
             )
             
             if template_action == "View Templates":
-                template_names = list(st.session_state.email_templates.keys())
+                template_names = st.session_state._template_keys
                 if template_names:
                     selected_template = st.selectbox("Select template to view:", template_names)
                     template = st.session_state.email_templates[selected_template]
@@ -879,6 +1099,7 @@ def main():
                                 "text_content": template_text
                             }
                             st.session_state.email_templates[template_name.lower().replace(' ', '_')] = custom_template
+                            st.session_state._template_keys = list(st.session_state.email_templates)
                             st.success(f"Template '{template_name}' saved successfully!")
                         else:
                             st.error("Please fill in all required fields (Name, Subject, HTML Content)")
@@ -904,11 +1125,17 @@ def main():
                     
                     if uploaded_recipients:
                         try:
-                            df_recipients = pd.read_csv(uploaded_recipients)
+                            # Only parse the email column; other columns are never used
+                            df_recipients = pd.read_csv(
+                                uploaded_recipients,
+                                usecols=lambda column: column == 'email',
+                                dtype={'email': 'string'}
+                            )
                             if 'email' in df_recipients.columns:
-                                recipient_emails = df_recipients['email'].dropna().tolist()
+                                recipient_emails = df_recipients['email'].dropna().unique().tolist()
                                 st.success(f"Loaded {len(recipient_emails)} recipients from file!")
                                 st.session_state.scraped_emails = recipient_emails
+                                bump_version('scraped_emails')
                             else:
                                 st.error("CSV file must contain an 'email' column.")
                         except Exception as e:
@@ -930,7 +1157,8 @@ def main():
                             recipients = st.session_state.scraped_emails
                         elif recipient_source == "Validated emails only":
                             if st.session_state.validated_emails:
-                                recipients = [r['email'] for r in st.session_state.validated_emails if r['is_valid']]
+                                recipients = [r['email'] for r in compress(st.session_state.validated_emails,
+                                                                           valid_mask(st.session_state.validated_emails))]
                             else:
                                 recipients = []
                                 st.warning("No validated emails available.")
@@ -954,7 +1182,7 @@ def main():
                         )
                         
                         if template_choice == "Pre-built template":
-                            template_names = list(st.session_state.email_templates.keys())
+                            template_names = st.session_state._template_keys
                             selected_template_key = st.selectbox("Select template:", template_names)
                             selected_template = st.session_state.email_templates[selected_template_key]
                             
@@ -970,7 +1198,7 @@ def main():
                             campaign_text = selected_template.get('text_content', '')
                             
                         elif template_choice == "Custom template":
-                            custom_template_names = [k for k in st.session_state.email_templates.keys() if not k in ['guest_post', 'collaboration', 'press_inquiry', 'follow_up']]
+                            custom_template_names = [k for k in st.session_state._template_keys if not k in ['guest_post', 'collaboration', 'press_inquiry', 'follow_up']]
                             if custom_template_names:
                                 selected_custom = st.selectbox("Select custom template:", custom_template_names)
                                 custom_template = st.session_state.email_templates[selected_custom]
@@ -994,16 +1222,16 @@ def main():
                         if recipients:
                             st.metric("Recipients", len(recipients))
                             
-                            # Estimate sending time
-                            est_time_minutes = len(recipients) * 1 / 60  # 1 second per email
-                            if est_time_minutes < 1:
-                                st.metric("Est. Send Time", f"{len(recipients)} seconds")
-                            else:
-                                st.metric("Est. Send Time", f"{est_time_minutes:.1f} minutes")
+                            # One SendGrid request per batch of recipients
+                            send_requests = -(-len(recipients) // EmailCampaignManager.MAX_PERSONALIZATIONS)
+                            st.metric("Send Requests", send_requests)
                         
                         # Campaign options
                         st.write("**Campaign Options**")
-                        delay_between_emails = st.slider("Delay between emails (seconds):", 1, 10, 2)
+                        parallel_sends = st.slider(
+                            "Parallel sends:", 1, 16, 4,
+                            help="Batch requests kept in flight at once; SendGrid's rate limit is honoured automatically"
+                        )
                         
                         # Follow-up options
                         setup_followup = st.checkbox("Setup automatic follow-up")
@@ -1013,6 +1241,16 @@ def main():
                     
                     # Campaign launch
                     if st.button("🚀 Launch Campaign", type="primary"):
+                        # Drop malformed addresses before they cost SendGrid API calls
+                        if recipients:
+                            well_formed = pd.Series(recipients, dtype='string').str.fullmatch(
+                                RECIPIENT_PATTERN, na=False
+                            ).to_numpy()
+                            skipped = len(recipients) - int(well_formed.sum())
+                            if skipped:
+                                recipients = [r for r, ok in zip(recipients, well_formed) if ok]
+                                st.warning(f"Skipped {skipped} malformed recipient addresses.")
+                        
                         if not from_email:
                             st.error("Please enter a 'From' email address.")
                         elif not campaign_subject:
@@ -1024,7 +1262,7 @@ def main():
                         else:
                             try:
                                 # Initialize campaign manager
-                                campaign_manager = EmailCampaignManager()
+                                campaign_manager = get_campaign_manager()
                                 
                                 # Progress tracking
                                 progress_bar = st.progress(0)
@@ -1039,7 +1277,7 @@ def main():
                                         subject=campaign_subject,
                                         html_content=campaign_html if campaign_html else None,
                                         text_content=campaign_text if campaign_text else None,
-                                        delay_seconds=delay_between_emails
+                                        max_workers=parallel_sends
                                     )
                                 
                                 # Store campaign results
@@ -1064,7 +1302,7 @@ def main():
                                 
                                 # Setup follow-up if requested
                                 if setup_followup and followup_subject:
-                                    auto_reply = AutoReplyManager(campaign_manager)
+                                    auto_reply = get_auto_reply_manager()
                                     followup_id = auto_reply.schedule_followup(
                                         original_recipients=results["successful_sends"],
                                         from_email=from_email,
@@ -1115,6 +1353,7 @@ def main():
                                     "text_content": template_text
                                 }
                                 st.session_state.email_templates[template_key] = new_template
+                                st.session_state._template_keys = list(st.session_state.email_templates)
                                 st.success(f"Template '{template_name}' created successfully!")
                                 st.rerun()
                             else:
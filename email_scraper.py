@@ -1,110 +1,193 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+import soupsieve
 import re
+import html as html_lib
+import threading
 import time
 import urllib.parse
-from typing import List, Set
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 import trafilatura
+from utils import Throttle
+
+# Email regex pattern (RFC 5322 compliant); ASCII mode skips Unicode-aware matching
+EMAIL_PATTERN = re.compile(
+    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b', re.ASCII
+)
+
+# Parse filter: form scanning only needs forms
+FORMS_ONLY = SoupStrainer('form')
+
+# <footer>/<div> elements whose class mentions footer, contact or info (case-insensitive)
+FOOTER_SELECTOR = soupsieve.compile(
+    ':is(footer, div):is([class*="footer" i], [class*="contact" i], [class*="info" i])'
+)
+
+def normalize_url(url: str) -> str:
+    """Cache/dedupe key for a page URL: fragment and trailing slash removed."""
+    return urllib.parse.urldefrag(url).url.rstrip('/')
+
+def _keyword_regex(keywords: List[str]) -> Pattern[str]:
+    """Compile keywords into one alternation, so a single scan replaces a loop of `in` tests."""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+# Skip obvious non-contact emails
+SKIP_EMAIL_RE = _keyword_regex([
+    'unsubscribe@', 'noreply@', 'no-reply@', 'donotreply@', 'bounce@',
+    'newsletter@', 'updates@', 'notifications@', 'alerts@',
+    'privacy@', 'legal@', 'abuse@', 'postmaster@', 'webmaster@',
+    'user@', 'member@', 'customer@', 'client@', 'account@',
+    'billing@', 'payment@', 'orders@', 'shipping@', 'tracking@'
+])
+
+# Contact-related keywords in the email address itself
+CONTACT_EMAIL_RE = _keyword_regex([
+    'contact', 'info', 'hello', 'hi', 'editor', 'editorial',
+    'press', 'media', 'news', 'pr@', 'publicrelations',
+    'advertising', 'ads@', 'marketing', 'business', 'sales',
+    'partnerships', 'collaborate', 'guest', 'write', 'author',
+    'submit', 'pitch', 'story', 'article', 'content',
+    'inquiry', 'inquiries', 'general', 'main@', 'office@'
+])
+
+# Context clues around the email
+CONTACT_CONTEXT_RE = _keyword_regex([
+    'contact us', 'get in touch', 'reach out', 'write for us',
+    'write to us', 'send us', 'email us', 'contact form',
+    'editorial team', 'editor', 'editorial', 'newsroom',
+    'press inquiries', 'media contact', 'media kit',
+    'advertising', 'advertise', 'sponsor', 'partnership',
+    'collaborate', 'guest post', 'guest author', 'contributor',
+    'submit', 'pitch', 'story idea', 'news tip',
+    'business inquiries', 'business contact', 'general inquiries',
+    'customer service', 'support', 'help', 'questions',
+    'feedback', 'suggestions', 'complaints'
+])
+
+# Footer, header or contact section markup
+CONTACT_SECTION_RE = _keyword_regex([
+    '<footer', 'class="footer', 'id="footer', 'footer-',
+    '<header', 'class="header', 'id="header', 'header-',
+    'class="contact', 'id="contact', 'contact-',
+    'class="about', 'id="about', 'about-'
+])
+
+# Contact-related words in a link's text
+CONTACT_LINK_TEXT_RE = _keyword_regex([
+    'contact', 'about', 'team', 'staff', 'directory',
+    'people', 'leadership', 'management', 'support'
+])
+
+# Social media domains
+SOCIAL_DOMAIN_RE = _keyword_regex([
+    'facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com',
+    'youtube.com', 'tiktok.com', 'pinterest.com'
+])
+
+# Obvious placeholder emails and file names that look like emails
+PLACEHOLDER_EMAIL_RE = _keyword_regex([
+    'example.com', 'test.com', 'domain.com', 'yoursite.com',
+    'yourdomain.com', 'email.com', 'mail.com', 
+    '.png', '.jpg', '.gif', '.pdf', '.doc'
+])
 
 class EmailScraper:
-    def __init__(self, delay: int = 2, max_pages: int = 5):
+    # Recently fetched pages kept per scraper, and how long they stay fresh
+    PAGE_CACHE_SIZE = 128
+    PAGE_CACHE_TTL = 600
+    
+    # Largest response body read per page; the rest of an oversized page is never downloaded
+    MAX_PAGE_BYTES = 5 * 1024 * 1024
+    
+    def __init__(self, delay: int = 2, max_pages: int = 5, pattern: Optional[Pattern[str]] = None,
+                 max_concurrent: int = 1):
         """
         Initialize the email scraper with rate limiting and page limits.
         
         Args:
             delay: Delay between requests in seconds
             max_pages: Maximum number of pages to scrape per website
+            pattern: Precompiled regex used to find emails (defaults to EMAIL_PATTERN)
+            max_concurrent: Number of pages fetched at the same time (1 fetches sequentially)
         """
         self.delay = delay
         self.max_pages = max_pages
+        self.max_concurrent = max(1, max_concurrent)
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate'
         })
         
-        # Email regex pattern (RFC 5322 compliant)
-        self.email_pattern = re.compile(
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        # Keep-alive pool sized for concurrent fetches, with a short backoff on connection errors
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=max(10, self.max_concurrent),
+            max_retries=Retry(total=2, backoff_factor=0.3)
         )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # normalized URL -> (fetched_at, (html_content, text_content)), oldest first
+        self._page_cache = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        
+        self.email_pattern = pattern or EMAIL_PATTERN
         
         # Common contact page patterns
         self.contact_patterns = [
             '/contact', '/contact-us', '/about', '/about-us', '/team',
             '/staff', '/directory', '/people', '/leadership'
         ]
+        self._contact_href_re = _keyword_regex(self.contact_patterns)
     
     def is_contact_email(self, email: str, context: str) -> bool:
         """Determine if an email is likely a contact/editorial/business email based on context."""
-        email_lower = email.lower()
         context_lower = context.lower()
-        
+        return self._is_contact_email(email.lower(), context_lower,
+                                      CONTACT_SECTION_RE.search(context_lower) is not None)
+    
+    def _is_contact_email(self, email_lower: str, context_lower: str, in_contact_section: bool) -> bool:
+        """is_contact_email on pre-lowercased input, with the per-context section check done by the caller."""
         # Skip obvious non-contact emails
-        skip_patterns = [
-            'unsubscribe@', 'noreply@', 'no-reply@', 'donotreply@', 'bounce@',
-            'newsletter@', 'updates@', 'notifications@', 'alerts@',
-            'privacy@', 'legal@', 'abuse@', 'postmaster@', 'webmaster@',
-            'user@', 'member@', 'customer@', 'client@', 'account@',
-            'billing@', 'payment@', 'orders@', 'shipping@', 'tracking@'
-        ]
-        
-        if any(pattern in email_lower for pattern in skip_patterns):
+        if SKIP_EMAIL_RE.search(email_lower):
             return False
         
         # Look for contact-related keywords in email address
-        contact_email_keywords = [
-            'contact', 'info', 'hello', 'hi', 'editor', 'editorial',
-            'press', 'media', 'news', 'pr@', 'publicrelations',
-            'advertising', 'ads@', 'marketing', 'business', 'sales',
-            'partnerships', 'collaborate', 'guest', 'write', 'author',
-            'submit', 'pitch', 'story', 'article', 'content',
-            'inquiry', 'inquiries', 'general', 'main@', 'office@'
-        ]
-        
-        if any(keyword in email_lower for keyword in contact_email_keywords):
+        if CONTACT_EMAIL_RE.search(email_lower):
             return True
         
-        # Look for context clues around the email
-        contact_context_keywords = [
-            'contact us', 'get in touch', 'reach out', 'write for us',
-            'write to us', 'send us', 'email us', 'contact form',
-            'editorial team', 'editor', 'editorial', 'newsroom',
-            'press inquiries', 'media contact', 'media kit',
-            'advertising', 'advertise', 'sponsor', 'partnership',
-            'collaborate', 'guest post', 'guest author', 'contributor',
-            'submit', 'pitch', 'story idea', 'news tip',
-            'business inquiries', 'business contact', 'general inquiries',
-            'customer service', 'support', 'help', 'questions',
-            'feedback', 'suggestions', 'complaints'
-        ]
-        
         # Check if email appears near contact-related text
         email_pos = context_lower.find(email_lower)
         if email_pos != -1:
-            # Check 200 characters before and after the email
+            # Check 200 characters before and after the email, searching in place instead of slicing
             start_pos = max(0, email_pos - 200)
-            end_pos = min(len(context_lower), email_pos + len(email_lower) + 200)
-            surrounding_text = context_lower[start_pos:end_pos]
+            end_pos = email_pos + len(email_lower) + 200
             
-            if any(keyword in surrounding_text for keyword in contact_context_keywords):
+            if CONTACT_CONTEXT_RE.search(context_lower, start_pos, end_pos):
                 return True
         
         # Check if email is in footer, header, or contact section
-        if any(section in context_lower for section in [
-            '<footer', 'class="footer', 'id="footer', 'footer-',
-            '<header', 'class="header', 'id="header', 'header-',
-            'class="contact', 'id="contact', 'contact-',
-            'class="about', 'id="about', 'about-'
-        ]):
-            return True
-        
-        return False
+        return in_contact_section
     
     def extract_emails_from_text(self, text: str, html_context: str = "") -> Set[str]:
         """Extract contact-related email addresses from text using context-aware filtering."""
-        if not text:
+        # A plain '@' scan is far cheaper than the regex and rules out most text blocks
+        if not text or '@' not in text:
             return set()
         
         emails = set(self.email_pattern.findall(text))
+        if not emails:
+            return set()
+        
+        # Lowercase the context and check its section markup once, not once per candidate email
+        context_lower = f"{text} {html_context}".lower()
+        in_contact_section = CONTACT_SECTION_RE.search(context_lower) is not None
         
         # Filter out common false positives and non-contact emails
         filtered_emails = set()
@@ -112,96 +195,161 @@ class EmailScraper:
             email_lower = email.lower()
             
             # Skip obvious placeholder emails
-            if any(placeholder in email_lower for placeholder in [
-                'example.com', 'test.com', 'domain.com', 'yoursite.com',
-                'yourdomain.com', 'email.com', 'mail.com', 
-                '.png', '.jpg', '.gif', '.pdf', '.doc'
-            ]):
+            if PLACEHOLDER_EMAIL_RE.search(email_lower):
                 continue
             
             # Use context-aware filtering to identify contact emails
-            combined_context = f"{text} {html_context}"
-            if self.is_contact_email(email, combined_context):
-                filtered_emails.add(email)
+            if self._is_contact_email(email_lower, context_lower, in_contact_section):
+                filtered_emails.add(email_lower)
         
         return filtered_emails
     
-    def get_page_content(self, url: str) -> tuple:
+    def extract_text(self, html_content: str) -> str:
+        """Extract clean page text with trafilatura."""
+        return trafilatura.extract(html_content) or ""
+    
+    def cached_page(self, url: str) -> Optional[tuple]:
+        """
+        Return the cached (html_content, text_content) for a URL if it is still fresh.
+        
+        text_content is None when the page was fetched without text extraction.
+        """
+        key = normalize_url(url)
+        with self._page_cache_lock:
+            entry = self._page_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.PAGE_CACHE_TTL:
+                del self._page_cache[key]
+                return None
+            self._page_cache.move_to_end(key)
+            return entry[1]
+    
+    def get_page_content(self, url: str, extract_text: bool = True) -> tuple:
         """
         Fetch page content and return both raw HTML and extracted text.
         
+        Successful fetches are cached by normalized URL, so repeated scrapes of
+        the same site within PAGE_CACHE_TTL seconds skip the network and parse.
+        
+        Args:
+            url: Page URL to fetch
+            extract_text: Whether to run trafilatura; when False text_content is ""
+        
         Returns:
             tuple: (html_content, text_content)
         """
+        cached = self.cached_page(url)
+        
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            if cached is not None:
+                html_content, text_content = cached
+            else:
+                with self.session.get(url, timeout=10, stream=True) as response:
+                    response.raise_for_status()
+                    
+                    # Skip binary links (PDFs, images, archives) without downloading their bodies
+                    content_type = response.headers.get('Content-Type', '').lower()
+                    if content_type and not content_type.startswith(('text/', 'application/xhtml')):
+                        print(f"Skipping non-HTML content at {url}: {content_type}")
+                        return "", ""
+                    
+                    # Get raw HTML, reading at most MAX_PAGE_BYTES
+                    body = bytearray()
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        body += chunk
+                        if len(body) >= self.MAX_PAGE_BYTES:
+                            del body[self.MAX_PAGE_BYTES:]
+                            break
+                    html_content = body.decode(response.encoding or 'utf-8', errors='replace')
+                text_content = None
             
-            # Get raw HTML
-            html_content = response.text
+            if cached is not None and (text_content is not None or not extract_text):
+                return html_content, text_content or ""
             
             # Extract clean text using trafilatura
-            text_content = trafilatura.extract(html_content) or ""
+            if extract_text:
+                text_content = self.extract_text(html_content)
+            
+            key = normalize_url(url)
+            with self._page_cache_lock:
+                self._page_cache[key] = (time.monotonic(), (html_content, text_content))
+                self._page_cache.move_to_end(key)
+                if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+                    self._page_cache.popitem(last=False)
             
-            return html_content, text_content
+            return html_content, text_content or ""
             
         except Exception as e:
             print(f"Error fetching {url}: {str(e)}")
             return "", ""
     
-    def find_contact_pages(self, base_url: str, html_content: str) -> List[str]:
-        """Find potential contact pages from the main page."""
+    def extract_page_emails(self, html_content: str) -> Set[str]:
+        """
+        Extract contact emails from a whole page in a single pass.
+        
+        Entities are decoded first, so obfuscated addresses like info&#64;site.com
+        are found without a separate pass over trafilatura's plain text.
+        """
+        return self.extract_emails_from_text(html_lib.unescape(html_content))
+    
+    def extract_links(self, html_content: str) -> List[Tuple[str, str]]:
+        """
+        Collect every link on a page in one lxml pass.
+        
+        Args:
+            html_content: Raw page HTML
+            
+        Returns:
+            (href, link text) pairs in document order
+        """
+        try:
+            # Parse bytes with an explicit encoding so XHTML pages with an
+            # <?xml encoding=...?> declaration are accepted
+            parser = lxml.html.HTMLParser(encoding='utf-8')
+            doc = lxml.html.document_fromstring(html_content.encode('utf-8'), parser=parser)
+            return [(link.get('href'), link.text_content()) for link in doc.iterfind('.//a[@href]')]
+        except Exception as e:
+            print(f"Error extracting links: {str(e)}")
+            return []
+    
+    def find_contact_pages(self, base_url: str, links: List[Tuple[str, str]]) -> List[str]:
+        """Find potential contact pages among the main page's (href, text) links."""
         contact_urls = []
+        seen = {base_url}
+        limit = self.max_pages - 1  # Limit contact pages
+        if limit <= 0:
+            return contact_urls
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Find all links
-            links = soup.find_all('a', href=True)
-            
-            for link in links:
-                href = link['href']
-                
-                # Convert relative URLs to absolute
-                full_url = urllib.parse.urljoin(base_url, href)
-                
+            for href, link_text in links:
                 # Check if link text or URL contains contact-related keywords
-                link_text = link.get_text().lower().strip()
-                href_lower = href.lower()
-                
-                contact_keywords = [
-                    'contact', 'about', 'team', 'staff', 'directory',
-                    'people', 'leadership', 'management', 'support'
-                ]
-                
-                if any(keyword in link_text for keyword in contact_keywords) or \
-                   any(pattern in href_lower for pattern in self.contact_patterns):
-                    if full_url not in contact_urls and full_url != base_url:
+                if CONTACT_LINK_TEXT_RE.search(link_text.lower()) or \
+                   self._contact_href_re.search(href.lower()):
+                    # Convert relative URLs to absolute
+                    full_url = urllib.parse.urljoin(base_url, href)
+                    
+                    if full_url not in seen:
+                        seen.add(full_url)
                         contact_urls.append(full_url)
+                        if len(contact_urls) >= limit:
+                            break
                         
         except Exception as e:
             print(f"Error finding contact pages: {str(e)}")
         
-        return contact_urls[:self.max_pages - 1]  # Limit contact pages
+        return contact_urls
     
-    def extract_social_links(self, html_content: str) -> List[str]:
-        """Extract social media profile links."""
+    def extract_social_links(self, links: List[Tuple[str, str]]) -> List[str]:
+        """Extract social media profile links from the page's (href, text) links."""
         social_urls = []
+        seen = set()
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Social media domains
-            social_domains = [
-                'facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com',
-                'youtube.com', 'tiktok.com', 'pinterest.com'
-            ]
-            
-            links = soup.find_all('a', href=True)
-            
-            for link in links:
-                href = link['href']
-                if any(domain in href for domain in social_domains):
+            for href, _ in links:
+                # Profiles are usually linked from both header and footer; keep each once
+                if href not in seen and SOCIAL_DOMAIN_RE.search(href):
+                    seen.add(href)
                     social_urls.append(href)
                     
         except Exception as e:
@@ -209,7 +357,41 @@ class EmailScraper:
         
         return social_urls
     
-    def scrape_website(self, url: str, scrape_options: List[str]) -> List[str]:
+    def scrape_pages(self, pages: List[Tuple[str, str]], throttles: Dict[str, Throttle]) -> Set[str]:
+        """
+        Fetch pages (in parallel when max_concurrent > 1) and extract their contact emails.
+        
+        Args:
+            pages: (url, label) pairs; the label is used in progress output
+            throttles: Per-host throttles shared across the crawl, so each host
+                still sees at most one request per `delay` seconds
+            
+        Returns:
+            Set of emails found across all pages
+        """
+        def scrape_page(page: Tuple[str, str], throttle: Throttle) -> Set[str]:
+            page_url, label = page
+            print(f"{label}: {page_url}")
+            if self.cached_page(page_url) is None:
+                throttle.wait()  # Rate limiting
+            
+            page_html, _ = self.get_page_content(page_url, extract_text=False)
+            return self.extract_page_emails(page_html)
+        
+        # Resolve throttles up front so worker threads never race on the dict
+        page_throttles = [
+            throttles.setdefault(urllib.parse.urlsplit(page_url).netloc, Throttle(self.delay))
+            for page_url, _ in pages
+        ]
+        
+        emails = set()
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrent, len(pages) or 1)) as executor:
+            for page_emails in executor.map(scrape_page, pages, page_throttles):
+                emails.update(page_emails)
+        
+        return emails
+    
+    def scrape_website(self, url: str, scrape_options: List[str]) -> Set[str]:
         """
         Main scraping function that extracts emails from a website.
         
@@ -218,10 +400,18 @@ class EmailScraper:
             scrape_options: List of scraping sources to include
             
         Returns:
-            List of unique email addresses found
+            Set of unique (lowercased) email addresses found
         """
         all_emails = set()
         processed_urls = set()
+        throttles = {}
+        
+        # Resolve the requested sources once instead of rescanning the list at every branch
+        options = frozenset(scrape_options)
+        want_main = "Main content" in options
+        want_contact = not options.isdisjoint(("Contact pages", "About pages"))
+        want_social = "Social media links" in options
+        want_footer = "Footer" in options
         
         try:
             # Ensure URL has protocol
@@ -229,64 +419,56 @@ class EmailScraper:
                 url = 'https://' + url
             
             # Start with main page
-            if "Main content" in scrape_options:
+            if want_main:
                 print(f"Scraping main page: {url}")
-                html_content, text_content = self.get_page_content(url)
+                throttles[urllib.parse.urlsplit(url).netloc] = main_throttle = Throttle(self.delay)
+                if self.cached_page(url) is None:
+                    main_throttle.wait()
+                html_content, _ = self.get_page_content(url, extract_text=False)
                 
                 if html_content:
-                    # Extract contact emails from both HTML and text content with context
-                    emails_from_html = self.extract_emails_from_text(html_content, html_content)
-                    emails_from_text = self.extract_emails_from_text(text_content, html_content)
-                    all_emails.update(emails_from_html)
-                    all_emails.update(emails_from_text)
+                    # Extract contact emails from the entity-decoded HTML with context
+                    all_emails.update(self.extract_page_emails(html_content))
+                    
+                    processed_urls.add(normalize_url(url))
                     
-                    processed_urls.add(url)
+                    # Collect the main page's links once; contact and social discovery both read them
+                    if want_contact or want_social:
+                        links = self.extract_links(html_content)
+                    
+                    # Contact and social pages are queued and fetched as one batch, so they overlap
+                    pages = []
                     
                     # Find contact pages if requested
-                    if any(option in scrape_options for option in ["Contact pages", "About pages"]):
-                        contact_urls = self.find_contact_pages(url, html_content)
-                        
-                        for contact_url in contact_urls:
-                            if contact_url not in processed_urls:
-                                print(f"Scraping contact page: {contact_url}")
-                                time.sleep(self.delay)  # Rate limiting
-                                
-                                contact_html, contact_text = self.get_page_content(contact_url)
-                                if contact_html:
-                                    contact_emails_html = self.extract_emails_from_text(contact_html, contact_html)
-                                    contact_emails_text = self.extract_emails_from_text(contact_text, contact_html)
-                                    all_emails.update(contact_emails_html)
-                                    all_emails.update(contact_emails_text)
-                                    
-                                processed_urls.add(contact_url)
+                    if want_contact:
+                        for contact_url in self.find_contact_pages(url, links):
+                            if normalize_url(contact_url) not in processed_urls:
+                                pages.append((contact_url, "Scraping contact page"))
+                                processed_urls.add(normalize_url(contact_url))
                     
                     # Extract social media links if requested
-                    if "Social media links" in scrape_options:
-                        social_urls = self.extract_social_links(html_content)
-                        
-                        for social_url in social_urls[:3]:  # Limit social media scraping
-                            if social_url not in processed_urls:
-                                print(f"Checking social media: {social_url}")
-                                time.sleep(self.delay)
-                                
-                                social_html, social_text = self.get_page_content(social_url)
-                                if social_html:
-                                    social_emails_html = self.extract_emails_from_text(social_html, social_html)
-                                    social_emails_text = self.extract_emails_from_text(social_text, social_html)
-                                    all_emails.update(social_emails_html)
-                                    all_emails.update(social_emails_text)
-                                
-                                processed_urls.add(social_url)
+                    if want_social:
+                        for social_url in self.extract_social_links(links)[:3]:  # Limit social media scraping
+                            if normalize_url(social_url) not in processed_urls:
+                                pages.append((social_url, "Checking social media"))
+                                processed_urls.add(normalize_url(social_url))
+                    
+                    all_emails.update(self.scrape_pages(pages, throttles))
                     
                     # Special focus on footer content if requested
-                    if "Footer" in scrape_options:
-                        soup = BeautifulSoup(html_content, 'html.parser')
-                        footer_elements = soup.find_all(['footer', 'div'], 
-                                                      class_=re.compile(r'footer|contact|info', re.I))
+                    if want_footer:
+                        soup = BeautifulSoup(html_content, 'lxml')
                         
-                        for element in footer_elements:
-                            footer_text = element.get_text() if element else ""
-                            footer_html = str(element) if element else ""
+                        # Blocks nested inside an already selected block are skipped: their text and
+                        # markup are part of the outer block, so walking them again only repeats work
+                        selected = set()
+                        for element in FOOTER_SELECTOR.select(soup):
+                            if any(id(parent) in selected for parent in element.parents):
+                                continue
+                            selected.add(id(element))
+                            
+                            footer_text = element.get_text()
+                            footer_html = str(element)
                             footer_emails = self.extract_emails_from_text(footer_text, footer_html)
                             all_emails.update(footer_emails)
             
@@ -294,7 +476,7 @@ class EmailScraper:
             print(f"Error scraping website {url}: {str(e)}")
             raise e
         
-        return list(all_emails)
+        return all_emails
     
     def extract_from_contact_form(self, url: str) -> List[str]:
         """
@@ -303,20 +485,22 @@ class EmailScraper:
         emails = set()
         
         try:
-            html_content, _ = self.get_page_content(url)
+            html_content, _ = self.get_page_content(url, extract_text=False)
             if not html_content:
                 return list(emails)
             
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml', parse_only=FORMS_ONLY)
             
             # Look for contact forms
             forms = soup.find_all('form')
             
             for form in forms:
+                form_html = str(form)  # Serialized once, shared by every check below
+                
                 # Check form action URL
                 action = form.get('action', '')
                 if action:
-                    form_emails = self.extract_emails_from_text(action, str(form))
+                    form_emails = self.extract_emails_from_text(action, form_html)
                     emails.update(form_emails)
                 
                 # Check hidden input fields
@@ -324,12 +508,12 @@ class EmailScraper:
                 for inp in hidden_inputs:
                     value = inp.get('value', '')
                     if value:
-                        hidden_emails = self.extract_emails_from_text(value, str(form))
+                        hidden_emails = self.extract_emails_from_text(value, form_html)
                         emails.update(hidden_emails)
                 
                 # Check form labels and text
                 form_text = form.get_text()
-                form_emails = self.extract_emails_from_text(form_text, str(form))
+                form_emails = self.extract_emails_from_text(form_text, form_html)
                 emails.update(form_emails)
                 
         except Exception as e:
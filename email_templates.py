@@ -1,17 +1,14 @@
 """
 Email templates for different types of outreach campaigns.
+
+Each template is built once and shared; treat the returned dicts as read-only.
 """
 
-class EmailTemplates:
-    """Pre-built email templates for various campaign types."""
-    
-    @staticmethod
-    def get_guest_post_template():
-        """Template for guest posting opportunities."""
-        return {
-            "name": "Guest Post Pitch",
-            "subject": "Guest Post Proposal for {{site_name}}",
-            "html_content": """
+import textwrap
+from functools import lru_cache
+
+# Template bodies are dedented and stripped once at import so sends carry no indentation
+_GUEST_POST_HTML = textwrap.dedent("""
             <html>
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <p>Hi {{name}},</p>
@@ -48,8 +45,9 @@ class EmailTemplates:
                 {{author_website}}</p>
             </body>
             </html>
-            """,
-            "text_content": """
+            """).strip()
+
+_GUEST_POST_TEXT = textwrap.dedent("""
 Hi {{name}},
 
 I hope this email finds you well. My name is {{author_name}}, and I'm a {{author_title}} with expertise in {{expertise_area}}.
@@ -78,16 +76,9 @@ Best regards,
 {{author_name}}
 {{author_email}}
 {{author_website}}
-            """
-        }
-    
-    @staticmethod
-    def get_collaboration_template():
-        """Template for collaboration outreach."""
-        return {
-            "name": "Collaboration Opportunity",
-            "subject": "Partnership Opportunity with {{company_name}}",
-            "html_content": """
+            """).strip()
+
+_COLLABORATION_HTML = textwrap.dedent("""
             <html>
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <p>Hello {{name}},</p>
@@ -122,16 +113,9 @@ Best regards,
                 {{sender_email}}</p>
             </body>
             </html>
-            """
-        }
-    
-    @staticmethod
-    def get_press_inquiry_template():
-        """Template for press and media inquiries."""
-        return {
-            "name": "Press Inquiry",
-            "subject": "Media Inquiry: {{story_topic}}",
-            "html_content": """
+            """).strip()
+
+_PRESS_INQUIRY_HTML = textwrap.dedent("""
             <html>
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <p>Dear {{name}},</p>
@@ -161,16 +145,9 @@ Best regards,
                 {{journalist_phone}}</p>
             </body>
             </html>
-            """
-        }
-    
-    @staticmethod
-    def get_follow_up_template():
-        """Template for follow-up emails."""
-        return {
-            "name": "Follow-up Email",
-            "subject": "Following up on {{original_subject}}",
-            "html_content": """
+            """).strip()
+
+_FOLLOW_UP_HTML = textwrap.dedent("""
             <html>
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <p>Hi {{name}},</p>
@@ -189,12 +166,56 @@ Best regards,
                 {{sender_name}}</p>
             </body>
             </html>
-            """
+            """).strip()
+
+
+class EmailTemplates:
+    """Pre-built email templates for various campaign types."""
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_guest_post_template():
+        """Template for guest posting opportunities."""
+        return {
+            "name": "Guest Post Pitch",
+            "subject": "Guest Post Proposal for {{site_name}}",
+            "html_content": _GUEST_POST_HTML,
+            "text_content": _GUEST_POST_TEXT
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_collaboration_template():
+        """Template for collaboration outreach."""
+        return {
+            "name": "Collaboration Opportunity",
+            "subject": "Partnership Opportunity with {{company_name}}",
+            "html_content": _COLLABORATION_HTML
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_press_inquiry_template():
+        """Template for press and media inquiries."""
+        return {
+            "name": "Press Inquiry",
+            "subject": "Media Inquiry: {{story_topic}}",
+            "html_content": _PRESS_INQUIRY_HTML
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_follow_up_template():
+        """Template for follow-up emails."""
+        return {
+            "name": "Follow-up Email",
+            "subject": "Following up on {{original_subject}}",
+            "html_content": _FOLLOW_UP_HTML
         }
     
     @staticmethod
     def get_all_templates():
-        """Get all available templates."""
+        """Get all available templates as a new dict that callers may extend."""
         return {
             "guest_post": EmailTemplates.get_guest_post_template(),
             "collaboration": EmailTemplates.get_collaboration_template(),
@@ -1,41 +1,387 @@
+import asyncio
 import re
 import smtplib
+import dns.asyncresolver
 import dns.resolver
+import numpy as np
 import socket
+import sys
 import requests
-from typing import Dict, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import compress
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Pattern, TypeVar
 import time
+from utils import Throttle
+
+# RFC 5322 compliant email regex; ASCII mode skips Unicode-aware matching.
+# The dot-atom local part and the lookaheads also encode the RFC 5321 part
+# lengths and the dot placement rules, so no per-character checks follow a match.
+EMAIL_FORMAT_REGEX = re.compile(
+    r'^(?=[^@\n]{1,64}@)'
+    r'[a-zA-Z0-9!#$%&\'*+/=?^_`{|}~-]+(?:\.[a-zA-Z0-9!#$%&\'*+/=?^_`{|}~-]+)*'
+    r'@(?=.{1,253}$)[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$',
+    re.ASCII
+)
+
+# Same pattern anchored per line, so a whole newline-joined list is matched in one scan
+EMAIL_FORMAT_LINES_REGEX = re.compile(EMAIL_FORMAT_REGEX.pattern, re.ASCII | re.MULTILINE)
+
+T = TypeVar('T')
+
+# Known disposable email domains (blacklist)
+DISPOSABLE_DOMAINS = frozenset({
+    '10minutemail.com', 'guerrillamail.com', 'mailinator.com',
+    'temp-mail.org', 'throwaway.email', 'getnada.com',
+    'maildrop.cc', 'tempmail.email', 'yopmail.com',
+    'dispostable.com', 'fakeinbox.com', 'spambox.us'
+})
+
+# Common invalid/test domains
+INVALID_DOMAINS = frozenset({
+    'example.com', 'test.com', 'domain.com', 'yoursite.com',
+    'yourdomain.com', 'email.com', 'localhost'
+})
+
+def load_domain_list(path: str) -> List[str]:
+    """
+    Read a published domain blocklist: one domain per line, '#' starts a comment.
+    
+    Args:
+        path: Path to the list file
+        
+    Returns:
+        list: Lowercased domains in file order
+    """
+    domains = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            domain = line.partition('#')[0].strip().lower()
+            if domain:
+                domains.append(domain)
+    return domains
+
+class StageResult:
+    """Base for per-stage validation results; slotted subclasses carry no __dict__."""
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, any]:
+        """Plain-dict form, as stored in validate_email()'s validation_details."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+@dataclass(slots=True)
+class BlacklistResult(StageResult):
+    is_blacklisted: bool = False
+    is_disposable: bool = False
+    is_invalid_domain: bool = False
+
+@dataclass(slots=True)
+class DNSResult(StageResult):
+    has_mx: bool = False
+    has_a: bool = False
+    mx_records: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+@dataclass(slots=True)
+class SMTPResult(StageResult):
+    smtp_valid: Optional[bool] = False
+    smtp_response: Optional[str] = None
+    error: Optional[str] = None
+
+def resolve_mx(domain: str, resolver: Optional[dns.resolver.Resolver] = None) -> List[str]:
+    """
+    Look up the mail exchangers for a domain.
+    
+    Args:
+        domain: Domain to resolve
+        resolver: Resolver to use (defaults to the system resolver)
+        
+    Returns:
+        MX host names ordered by preference, empty if the domain has none
+    """
+    resolver = resolver or dns.resolver.get_default_resolver()
+    
+    try:
+        answer = resolver.resolve(domain, 'MX')
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+        return []
+    
+    return _mx_hosts(answer)
+
+def resolve_mx_bulk(domains: List[str], resolver: Optional[dns.resolver.Resolver] = None,
+                    max_concurrent: int = 256) -> Dict[str, List[str]]:
+    """
+    Look up the mail exchangers for many domains concurrently on one event loop.
+    
+    Args:
+        domains: Domains to resolve
+        resolver: Resolver whose lifetime and answer cache are shared
+            (defaults to the system resolver)
+        max_concurrent: Queries allowed in flight at once
+        
+    Returns:
+        MX host names per domain, as in resolve_mx(); domains whose lookup
+        failed for any other reason are left out
+    """
+    resolver = resolver or dns.resolver.get_default_resolver()
+    async_resolver = dns.asyncresolver.Resolver()
+    async_resolver.lifetime = resolver.lifetime
+    async_resolver.cache = resolver.cache  # answers land where later sync lookups find them
+    
+    async def resolve_all():
+        semaphore = asyncio.Semaphore(max_concurrent)
+        
+        async def resolve_one(domain):
+            async with semaphore:
+                try:
+                    return _mx_hosts(await async_resolver.resolve(domain, 'MX'))
+                except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                    return []
+        
+        return await asyncio.gather(*(resolve_one(domain) for domain in domains), return_exceptions=True)
+    
+    results = asyncio.run(resolve_all())
+    return {domain: mx for domain, mx in zip(domains, results) if not isinstance(mx, BaseException)}
+
+def _mx_hosts(answer) -> List[str]:
+    return [str(mx.exchange).rstrip('.') for mx in sorted(answer, key=lambda mx: mx.preference)]
+
+class SMTPConnectionPool:
+    """Idle SMTP connections kept open per MX host and reused across probes."""
+    
+    def __init__(self, timeout: int = 10, max_uses: int = 1000, check_after: float = 5.0,
+                 idle_ttl: float = 60.0, max_idle_per_host: int = 4, max_idle: int = 64):
+        """
+        Initialize the connection pool.
+        
+        Args:
+            timeout: Timeout for SMTP operations in seconds
+            max_uses: Probes per connection before it is closed and replaced
+            check_after: Idle seconds after which a connection is NOOP-checked before reuse
+            idle_ttl: Idle seconds after which a connection is quit instead of reused
+            max_idle_per_host: Idle connections kept per MX host; extras are quit
+            max_idle: Idle connections kept across all hosts; the longest idle are quit first
+        """
+        self.timeout = timeout
+        self.max_uses = max_uses
+        self.check_after = check_after
+        self.idle_ttl = idle_ttl
+        self.max_idle_per_host = max_idle_per_host
+        self.max_idle = max_idle
+        self._idle = {}  # host -> list of (server, uses, released_at), oldest first
+        self._idle_count = 0
+        self._lock = threading.Lock()
+    
+    def run(self, host: str, probe: Callable[[smtplib.SMTP], T]) -> T:
+        """
+        Run a probe on a borrowed, greeted connection to a host; it is reset and
+        returned to the pool on success.
+        
+        New connections say EHLO so ESMTP extensions such as PIPELINING are
+        known, falling back to HELO for servers that reject it. Servers drop
+        idle sessions without warning, so a reused connection can fail on its
+        first command: when a pooled connection raises a connection-level
+        error, the probe is run once more on a new connection instead of
+        surfacing the error as the probe's outcome.
+        
+        Args:
+            host: MX host to connect to
+            probe: Called with the greeted connection; must be safe to call again
+            
+        Returns:
+            Whatever probe returns
+            
+        Raises:
+            smtplib.SMTPHeloError: If a new connection is refused at HELO
+        """
+        server, uses = self._checkout(host)
+        try:
+            result = probe(server)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            self._close(server)
+            if not uses:
+                raise
+            server, uses = self._checkout(host, fresh=True)
+            try:
+                result = probe(server)
+            except BaseException:
+                self._close(server)
+                raise
+        except BaseException:
+            self._close(server)
+            raise
+        self._checkin(host, server, uses + 1)
+        return result
+    
+    def close_all(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+            self._idle_count = 0
+        
+        for connections in idle.values():
+            for server, _, _ in connections:
+                self._close(server)
+    
+    def _checkout(self, host: str, fresh: bool = False):
+        while not fresh:
+            entry = None
+            with self._lock:
+                expired = self._evict_expired()
+                connections = self._idle.get(host)
+                if connections:
+                    entry = connections.pop()
+                    self._idle_count -= 1
+                    if not connections:
+                        del self._idle[host]
+            
+            for stale in expired:
+                self._close(stale)
+            if entry is None:
+                break
+            server, uses, released_at = entry
+            
+            # Servers drop idle sessions, so verify anything that sat for a while
+            if time.monotonic() - released_at < self.check_after:
+                return server, uses
+            try:
+                if server.noop()[0] == 250:
+                    return server, uses
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close(server)
+        
+        server = smtplib.SMTP(timeout=self.timeout)
+        try:
+            server.connect(host, 25)
+            code, response = server.ehlo('example.com')
+            if code != 250:
+                code, response = server.helo('example.com')
+        except BaseException:
+            self._close(server)
+            raise
+        if code != 250:
+            self._close(server)
+            raise smtplib.SMTPHeloError(code, response)
+        return server, 0
+    
+    def _checkin(self, host: str, server: smtplib.SMTP, uses: int):
+        if uses >= self.max_uses:
+            self._close(server)
+            return
+        
+        try:
+            server.rset()
+        except (smtplib.SMTPException, OSError):
+            self._close(server)
+            return
+        
+        with self._lock:
+            evicted = self._evict_expired()
+            connections = self._idle.setdefault(host, [])
+            connections.append((server, uses, time.monotonic()))
+            self._idle_count += 1
+            
+            if len(connections) > self.max_idle_per_host:
+                evicted.append(connections.pop(0)[0])
+                self._idle_count -= 1
+            
+            while self._idle_count > self.max_idle:
+                # Longest-idle connection across hosts; each host's list is oldest first
+                oldest_host = min(self._idle, key=lambda h: self._idle[h][0][2])
+                evicted.append(self._idle[oldest_host].pop(0)[0])
+                self._idle_count -= 1
+                if not self._idle[oldest_host]:
+                    del self._idle[oldest_host]
+        
+        for stale in evicted:
+            self._close(stale)
+    
+    def _evict_expired(self) -> List[smtplib.SMTP]:
+        """Unlink connections idle longer than idle_ttl; the caller quits them outside the lock."""
+        cutoff = time.monotonic() - self.idle_ttl
+        expired = []
+        for host in list(self._idle):
+            connections = self._idle[host]
+            keep = 0
+            while keep < len(connections) and connections[keep][2] < cutoff:
+                keep += 1
+            if keep:
+                expired.extend(server for server, _, _ in connections[:keep])
+                del connections[:keep]
+                self._idle_count -= keep
+            if not connections:
+                del self._idle[host]
+        return expired
+    
+    @staticmethod
+    def _close(server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
 
 class EmailValidator:
-    def __init__(self, enable_smtp: bool = True, timeout: int = 10):
+    # Recipients probed per MAIL FROM transaction; servers commonly cap this at 100
+    RCPT_BATCH_SIZE = 50
+    DNS_CACHE_SIZE = 10000
+    DOMAIN_CACHE_SIZE = 10000
+    DOMAIN_CACHE_TTL = 300  # seconds
+    
+    def __init__(self, enable_smtp: bool = True, timeout: int = 10,
+                 mx_lookup: Optional[Callable[[str], List[str]]] = None,
+                 pattern: Optional[Pattern[str]] = None,
+                 disposable_list: Optional[str] = None):
         """
         Initialize the email validator.
         
         Args:
             enable_smtp: Whether to perform SMTP verification
             timeout: Timeout for network operations in seconds
+            mx_lookup: Optional replacement for MX resolution (e.g. a cached one)
+            pattern: Precompiled format regex, matched from the start of the address
+                (defaults to EMAIL_FORMAT_REGEX)
+            disposable_list: Optional file of extra disposable domains (see
+                load_domain_list), added to DISPOSABLE_DOMAINS
         """
         self.enable_smtp = enable_smtp
         self.timeout = timeout
         
-        # RFC 5322 compliant email regex
-        self.email_regex = re.compile(
-            r'^[a-zA-Z0-9.!#$%&\'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$'
-        )
-        
-        # Known disposable email domains (blacklist)
-        self.disposable_domains = {
-            '10minutemail.com', 'guerrillamail.com', 'mailinator.com',
-            'temp-mail.org', 'throwaway.email', 'getnada.com',
-            'maildrop.cc', 'tempmail.email', 'yopmail.com',
-            'dispostable.com', 'fakeinbox.com', 'spambox.us'
-        }
-        
-        # Common invalid/test domains
-        self.invalid_domains = {
-            'example.com', 'test.com', 'domain.com', 'yoursite.com',
-            'yourdomain.com', 'email.com', 'localhost'
-        }
+        # Shared resolver so cached validators keep one DNS configuration
+        self.resolver = dns.resolver.Resolver()
+        self.resolver.lifetime = timeout
+        # TTL-honouring answer cache, so MX and A lookups for repeated domains stay local
+        self.resolver.cache = dns.resolver.LRUCache(max_size=self.DNS_CACHE_SIZE)
+        self.mx_lookup = mx_lookup or self.lookup_mx
+        self.smtp_pool = SMTPConnectionPool(timeout=timeout)
+        
+        # interned domain -> (checked_at, DNSResult), oldest first; shared by emails on one domain.
+        # Holds negative verdicts (no MX and no A records) too, so they expire with the same TTL
+        self._domain_cache = OrderedDict()
+        self._domain_cache_lock = threading.Lock()
+        
+        self.email_regex = pattern or EMAIL_FORMAT_REGEX
+        
+        self.disposable_domains = DISPOSABLE_DOMAINS
+        if disposable_list:
+            self.disposable_domains = DISPOSABLE_DOMAINS.union(load_domain_list(disposable_list))
+        self.invalid_domains = INVALID_DOMAINS
+        
+        # domain -> (is_disposable, is_invalid_domain), so a check is one hash probe;
+        # fromkeys shares a single flags tuple across a large published list
+        self._blocklist = dict.fromkeys(self.disposable_domains, (True, False))
+        for domain in self.invalid_domains:
+            self._blocklist[domain] = (domain in self._blocklist, True)
+    
+    def close(self):
+        """Close any pooled SMTP connections."""
+        self.smtp_pool.close_all()
+    
+    def lookup_mx(self, domain: str) -> List[str]:
+        """Resolve MX hosts for a domain with this validator's resolver."""
+        return resolve_mx(domain, self.resolver)
     
     def validate_format(self, email: str) -> bool:
         """
@@ -54,7 +400,55 @@ class EmailValidator:
         if not self.email_regex.match(email):
             return False
         
-        # Additional checks
+        # The default pattern already enforces part lengths and dot placement
+        return self.email_regex is EMAIL_FORMAT_REGEX or self._format_parts_ok(email)
+    
+    def validate_format_bulk(self, emails: List[str]) -> List[bool]:
+        """
+        Validate the format of many emails, running the regex once over the whole list.
+        
+        Length and dot placement are checked as vectorized NumPy string
+        operations, so only plausible addresses reach the regex.
+        
+        Args:
+            emails: Email addresses to validate
+            
+        Returns:
+            list: validate_format() result for each email, in input order
+        """
+        if self.email_regex is not EMAIL_FORMAT_REGEX:
+            return [self.validate_format(email) for email in emails]
+        
+        if not emails:
+            return []
+        
+        # Over-long entries can never match. Dropping them with a plain length check
+        # first keeps one stray long line from widening every row of the fixed-width
+        # array below (N x longest entry x 4 bytes)
+        candidates = [email for email in emails if len(email) <= 254]
+        if not candidates:
+            return [False] * len(emails)
+        
+        # The regex admits a single '@', so its position gives both part lengths
+        arr = np.array(candidates, dtype=np.str_)
+        lengths = np.strings.str_len(arr)
+        at = np.strings.find(arr, '@')
+        plausible = (at > 0) & (at <= 64) & (lengths - at - 1 <= 253)
+        
+        # Dots may not start or end either part, nor appear twice in a row
+        plausible &= ~np.strings.startswith(arr, '.') & ~np.strings.endswith(arr, '.')
+        for bad in ('..', '.@', '@.'):
+            plausible &= np.strings.find(arr, bad) < 0
+        
+        # Embedded newlines would split an entry into separate lines; such entries never
+        # match, and equal strings share a verdict, so membership alone decides each email
+        survivors = list(compress(candidates, plausible))
+        matched = set(EMAIL_FORMAT_LINES_REGEX.findall('\n'.join(survivors)))
+        return [email in matched for email in emails]
+    
+    @staticmethod
+    def _format_parts_ok(email: str) -> bool:
+        """Length and dot placement checks on an address that matched a custom format regex."""
         local, domain = email.rsplit('@', 1)
         
         # Local part checks
@@ -79,7 +473,7 @@ class EmailValidator:
         
         return True
     
-    def check_blacklist(self, email: str) -> Dict[str, bool]:
+    def check_blacklist(self, email: str) -> BlacklistResult:
         """
         Check if email domain is on blacklists.
         
@@ -87,149 +481,248 @@ class EmailValidator:
             email: Email address to check
             
         Returns:
-            dict: Results of blacklist checks
+            BlacklistResult: Results of blacklist checks
         """
         domain = email.split('@')[1].lower()
         
-        result = {
-            'is_blacklisted': False,
-            'is_disposable': False,
-            'is_invalid_domain': False
-        }
-        
-        # Check disposable email providers
-        if domain in self.disposable_domains:
-            result['is_disposable'] = True
-            result['is_blacklisted'] = True
-        
-        # Check invalid/test domains
-        if domain in self.invalid_domains:
-            result['is_invalid_domain'] = True
-            result['is_blacklisted'] = True
+        # Disposable providers and invalid/test domains share one lookup table
+        flags = self._blocklist.get(domain)
+        if flags is None:
+            return BlacklistResult()
         
         # Additional blacklist checks could be added here
         # For example, checking against external blacklist APIs
         
-        return result
+        return BlacklistResult(is_blacklisted=True, is_disposable=flags[0], is_invalid_domain=flags[1])
     
-    def validate_dns(self, email: str) -> Dict[str, any]:
+    def validate_dns(self, email: str) -> DNSResult:
         """
         Validate domain DNS records.
         
+        Verdicts are shared by every email on the same domain for DOMAIN_CACHE_TTL seconds.
+        
         Args:
             email: Email address to validate
             
         Returns:
-            dict: DNS validation results
+            DNSResult: DNS validation results
         """
-        domain = email.split('@')[1]
+        # Interned, so repeated domains share one string and its cached hash
+        domain = sys.intern(email.split('@')[1])
         
-        result = {
-            'has_mx': False,
-            'has_a': False,
-            'mx_records': [],
-            'error': None
-        }
+        with self._domain_cache_lock:
+            entry = self._domain_cache.get(domain)
+            if entry is not None:
+                if time.monotonic() - entry[0] <= self.DOMAIN_CACHE_TTL:
+                    self._domain_cache.move_to_end(domain)
+                    return entry[1]
+                del self._domain_cache[domain]
+        
+        result = DNSResult()
         
         try:
             # Check for MX records
-            try:
-                mx_records = dns.resolver.resolve(domain, 'MX')
-                result['has_mx'] = True
-                result['mx_records'] = [str(mx) for mx in mx_records]
-            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
-                result['has_mx'] = False
+            result.mx_records = self.mx_lookup(domain)
+            result.has_mx = bool(result.mx_records)
             
             # If no MX records, check for A records (fallback)
-            if not result['has_mx']:
+            if not result.has_mx:
                 try:
-                    a_records = dns.resolver.resolve(domain, 'A')
-                    result['has_a'] = True
+                    a_records = self.resolver.resolve(domain, 'A')
+                    result.has_a = True
                 except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
-                    result['has_a'] = False
+                    result.has_a = False
                     
         except Exception as e:
-            result['error'] = str(e)
+            result.error = str(e)
+            return result  # lookup errors are retried, not cached
+        
+        with self._domain_cache_lock:
+            self._domain_cache[domain] = (time.monotonic(), result)
+            if len(self._domain_cache) > self.DOMAIN_CACHE_SIZE:
+                self._domain_cache.popitem(last=False)
         
         return result
     
-    def validate_smtp(self, email: str) -> Dict[str, any]:
+    def validate_smtp(self, email: str, mx_host: Optional[str] = None) -> SMTPResult:
         """
         Validate email existence via SMTP.
         
         Args:
             email: Email address to validate
+            mx_host: Mail exchanger already resolved for the domain (e.g. by
+                validate_dns); looked up when omitted
             
         Returns:
-            dict: SMTP validation results
+            SMTPResult: SMTP validation results
         """
         if not self.enable_smtp:
-            return {'smtp_valid': None, 'error': 'SMTP validation disabled'}
+            return SMTPResult(smtp_valid=None, error='SMTP validation disabled')
         
         domain = email.split('@')[1]
         
-        result = {
-            'smtp_valid': False,
-            'smtp_response': None,
-            'error': None
-        }
+        result = SMTPResult()
         
         try:
             # Get MX records
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            mx_record = str(mx_records[0].exchange).rstrip('.')
-            
-            # Connect to SMTP server
-            with smtplib.SMTP(timeout=self.timeout) as server:
-                server.connect(mx_record, 25)
-                
-                # HELO command
-                code, response = server.helo('example.com')
-                if code != 250:
-                    result['error'] = f'HELO failed: {response}'
+            if mx_host is None:
+                mx_records = self.mx_lookup(domain)
+                if not mx_records:
+                    result.error = 'No MX records found'
                     return result
-                
-                # MAIL FROM command
-                code, response = server.mail('test@example.com')
+                mx_host = mx_records[0]
+            
+            def probe(server: smtplib.SMTP) -> SMTPResult:
+                if server.has_extn('pipelining'):
+                    # MAIL FROM and RCPT TO in one round trip
+                    (code, response), rcpt_reply = self._pipeline(
+                        server, [self._mail_from_cmd(), self._rcpt_to_cmd(email)])
+                else:
+                    # MAIL FROM command
+                    code, response = server.mail('test@example.com')
+                    rcpt_reply = None
                 if code != 250:
-                    result['error'] = f'MAIL FROM failed: {response}'
-                    return result
+                    return SMTPResult(error=f'MAIL FROM failed: {response}')
                 
                 # RCPT TO command
-                code, response = server.rcpt(email)
-                result['smtp_response'] = response.decode() if isinstance(response, bytes) else str(response)
+                return self._rcpt_result(*(rcpt_reply or server.rcpt(email)))
+            
+            # Borrow a connection (already past HELO) to the SMTP server; a pooled
+            # connection the server has since dropped is replaced and the probe rerun
+            result = self.smtp_pool.run(mx_host, probe)
+                
+        except Exception as e:
+            result.error = self._smtp_error(e)
+        
+        return result
+    
+    def validate_smtp_batch(self, mx_host: str, emails: List[str],
+                            throttle: Optional[Throttle] = None) -> Dict[str, SMTPResult]:
+        """
+        Validate many addresses on one mail server over a single connection.
+        
+        Recipients are probed RCPT_BATCH_SIZE at a time, each chunk sharing
+        one MAIL FROM, so connection and HELO cost is paid once per server.
+        Servers advertising PIPELINING get each chunk (RSET, MAIL FROM and
+        every RCPT TO) in a single write, costing one round trip per chunk.
+        
+        Args:
+            mx_host: Mail exchanger that accepts mail for every address given
+            emails: Email addresses to probe
+            throttle: Optional Throttle awaited before each chunk of recipients
+            
+        Returns:
+            dict: SMTP validation results keyed by email
+        """
+        results = {}
+        
+        def probe(server: smtplib.SMTP) -> None:
+            # On a rerun after a dropped connection, only addresses without a result are probed
+            pending = [email for email in emails if email not in results]
+            pipelining = server.has_extn('pipelining')
+            for start in range(0, len(pending), self.RCPT_BATCH_SIZE):
+                chunk = pending[start:start + self.RCPT_BATCH_SIZE]
+                if throttle is not None:
+                    throttle.wait()
                 
-                if code == 250:
-                    result['smtp_valid'] = True
-                elif code == 550:
-                    result['smtp_valid'] = False
+                if pipelining:
+                    commands = [self._mail_from_cmd()]
+                    commands.extend(map(self._rcpt_to_cmd, chunk))
+                    if start:
+                        commands.insert(0, 'RSET')
+                    replies = self._pipeline(server, commands)
+                    if start:
+                        replies = replies[1:]  # RSET reply, unchecked as before
+                    (code, response), rcpt_replies = replies[0], replies[1:]
                 else:
-                    result['smtp_valid'] = None
-                    result['error'] = f'Uncertain response: {code} {response}'
+                    if start:
+                        server.rset()
+                    code, response = server.mail('test@example.com')
+                    rcpt_replies = None
                 
-        except dns.resolver.NXDOMAIN:
-            result['error'] = 'No MX records found'
-        except dns.resolver.NoAnswer:
-            result['error'] = 'No MX records in DNS response'
-        except socket.timeout:
-            result['error'] = 'SMTP connection timeout'
-        except socket.gaierror as e:
-            result['error'] = f'DNS resolution error: {str(e)}'
-        except smtplib.SMTPConnectError as e:
-            result['error'] = f'SMTP connection error: {str(e)}'
-        except smtplib.SMTPServerDisconnected:
-            result['error'] = 'SMTP server disconnected'
+                if code != 250:
+                    error = f'MAIL FROM failed: {response}'
+                    for email in pending[start:]:
+                        results[email] = SMTPResult(error=error)
+                    break
+                
+                if rcpt_replies is not None:
+                    for email, reply in zip(chunk, rcpt_replies):
+                        results[email] = self._rcpt_result(*reply)
+                else:
+                    for email in chunk:
+                        results[email] = self._rcpt_result(*server.rcpt(email))
+        
+        try:
+            self.smtp_pool.run(mx_host, probe)
         except Exception as e:
-            result['error'] = f'SMTP validation error: {str(e)}'
+            error = self._smtp_error(e)
+            for email in emails:
+                results.setdefault(email, SMTPResult(error=error))
+        
+        return results
+    
+    @staticmethod
+    def _mail_from_cmd() -> str:
+        return f"MAIL FROM:{smtplib.quoteaddr('test@example.com')}"
+    
+    @staticmethod
+    def _rcpt_to_cmd(email: str) -> str:
+        return f"RCPT TO:{smtplib.quoteaddr(email)}"
+    
+    @staticmethod
+    def _pipeline(server: smtplib.SMTP, commands: List[str]) -> List[tuple]:
+        """Send commands in one write (RFC 2920 PIPELINING) and read a reply for each."""
+        for command in commands:
+            if '\r' in command or '\n' in command:
+                raise ValueError(f'command contains CR or LF: {command!r}')
+        server.send(''.join(f'{command}\r\n' for command in commands))
+        return [server.getreply() for _ in commands]
+    
+    @staticmethod
+    def _rcpt_result(code: int, response) -> SMTPResult:
+        """Interpret an RCPT TO reply as an SMTP validation result."""
+        result = SMTPResult(
+            smtp_valid=None,
+            smtp_response=response.decode() if isinstance(response, bytes) else str(response)
+        )
+        
+        if code == 250:
+            result.smtp_valid = True
+        elif code == 550:
+            result.smtp_valid = False
+        else:
+            result.error = f'Uncertain response: {code} {response}'
         
         return result
     
-    def validate_email(self, email: str) -> Dict[str, any]:
+    @staticmethod
+    def _smtp_error(e: Exception) -> str:
+        """Describe an exception raised while probing an SMTP server."""
+        if isinstance(e, smtplib.SMTPHeloError):
+            return f'HELO failed: {e.smtp_error}'
+        if isinstance(e, dns.resolver.NXDOMAIN):
+            return 'No MX records found'
+        if isinstance(e, dns.resolver.NoAnswer):
+            return 'No MX records in DNS response'
+        if isinstance(e, socket.timeout):
+            return 'SMTP connection timeout'
+        if isinstance(e, socket.gaierror):
+            return f'DNS resolution error: {str(e)}'
+        if isinstance(e, smtplib.SMTPConnectError):
+            return f'SMTP connection error: {str(e)}'
+        if isinstance(e, smtplib.SMTPServerDisconnected):
+            return 'SMTP server disconnected'
+        return f'SMTP validation error: {str(e)}'
+    
+    def validate_email(self, email: str, smtp_result: Optional[SMTPResult] = None) -> Dict[str, any]:
         """
         Perform complete 4-stage email validation.
         
         Args:
             email: Email address to validate
+            smtp_result: Precomputed SMTP result (e.g. from validate_smtp_batch)
+                used instead of probing the server again
             
         Returns:
             dict: Complete validation results
@@ -256,13 +749,13 @@ class EmailValidator:
             
             # Stage 2: Blacklist check
             blacklist_result = self.check_blacklist(email)
-            result['blacklist_check'] = not blacklist_result['is_blacklisted']
-            result['validation_details']['blacklist'] = blacklist_result
+            result['blacklist_check'] = not blacklist_result.is_blacklisted
+            result['validation_details']['blacklist'] = blacklist_result.to_dict()
             
-            if blacklist_result['is_blacklisted']:
-                if blacklist_result['is_disposable']:
+            if blacklist_result.is_blacklisted:
+                if blacklist_result.is_disposable:
                     result['error_message'] = 'Disposable email address'
-                elif blacklist_result['is_invalid_domain']:
+                elif blacklist_result.is_invalid_domain:
                     result['error_message'] = 'Invalid/test domain'
                 else:
                     result['error_message'] = 'Domain is blacklisted'
@@ -270,24 +763,26 @@ class EmailValidator:
             
             # Stage 3: DNS validation
             dns_result = self.validate_dns(email)
-            result['dns_valid'] = dns_result['has_mx'] or dns_result['has_a']
-            result['validation_details']['dns'] = dns_result
+            result['dns_valid'] = dns_result.has_mx or dns_result.has_a
+            result['validation_details']['dns'] = dns_result.to_dict()
             
             if not result['dns_valid']:
-                result['error_message'] = dns_result.get('error', 'No valid DNS records found')
+                result['error_message'] = dns_result.error
                 return result
             
             # Stage 4: SMTP validation (if enabled)
             if self.enable_smtp:
-                smtp_result = self.validate_smtp(email)
-                result['smtp_valid'] = smtp_result['smtp_valid']
-                result['validation_details']['smtp'] = smtp_result
+                # Reuse the MX that stage 3 resolved instead of looking it up again
+                mx_host = dns_result.mx_records[0] if dns_result.mx_records else None
+                smtp_result = smtp_result or self.validate_smtp(email, mx_host)
+                result['smtp_valid'] = smtp_result.smtp_valid
+                result['validation_details']['smtp'] = smtp_result.to_dict()
                 
-                if smtp_result['smtp_valid'] is False:
+                if smtp_result.smtp_valid is False:
                     result['error_message'] = 'Email address does not exist on server'
                     return result
-                elif smtp_result['error']:
-                    result['error_message'] = f"SMTP check failed: {smtp_result['error']}"
+                elif smtp_result.error:
+                    result['error_message'] = f"SMTP check failed: {smtp_result.error}"
                     # Don't return here - treat SMTP errors as inconclusive
             
             # Email is valid if it passes all available checks
@@ -303,24 +798,66 @@ class EmailValidator:
         
         return result
     
-    def validate_bulk(self, emails: List[str]) -> List[Dict[str, any]]:
+    def validate_bulk(self, emails: List[str], max_workers: int = 16,
+                      delay: float = 0.5) -> List[Dict[str, any]]:
         """
-        Validate multiple emails with rate limiting.
+        Validate multiple emails concurrently with per-domain rate limiting.
+        
+        With SMTP enabled, addresses are first grouped by mail server and probed
+        in batches over one connection per server, one chunk of recipients per
+        delay; the remaining stages then run per email and reuse those results.
         
         Args:
             emails: List of email addresses to validate
+            max_workers: Number of validations allowed in flight at once
+            delay: Minimum seconds between probes of the same domain (or, for
+                batched SMTP probes, between recipient chunks on one server)
             
         Returns:
-            List of validation results
+            List of validation results, in input order
         """
-        results = []
+        normalized = [email.strip().lower() for email in emails]
         
-        for i, email in enumerate(emails):
-            result = self.validate_email(email)
-            results.append(result)
-            
-            # Rate limiting - small delay between validations
-            if i < len(emails) - 1:
-                time.sleep(0.5)
+        # Different domains overlap freely; each domain sees at most one probe per delay
+        throttles = {domain: Throttle(delay)
+                     for domain in {email.rpartition('@')[2] for email in normalized}}
         
-        return results
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            smtp_results = {}
+            if self.enable_smtp:
+                unique = list(dict.fromkeys(normalized))
+                candidates = [email for email, format_ok in zip(unique, self.validate_format_bulk(unique))
+                              if format_ok and not self.check_blacklist(email).is_blacklisted]
+                
+                def mx_for(domain: str) -> List[str]:
+                    try:
+                        return self.mx_lookup(domain)
+                    except Exception:
+                        return []  # validate_email reports the DNS error
+                
+                domains = list({email.rpartition('@')[2] for email in candidates})
+                if self.mx_lookup == self.lookup_mx:
+                    # Default lookup: resolve every domain on one event loop, warming the shared cache
+                    mx_by_domain = resolve_mx_bulk(domains, self.resolver)
+                else:
+                    mx_by_domain = dict(zip(domains, executor.map(mx_for, domains)))
+                
+                by_mx = {}
+                for email in candidates:
+                    mx_records = mx_by_domain.get(email.rpartition('@')[2])
+                    if mx_records:
+                        by_mx.setdefault(mx_records[0], []).append(email)
+                
+                # Batched probes are paced per mail server, one RCPT chunk per delay
+                for batch in executor.map(
+                        lambda item: self.validate_smtp_batch(*item, throttle=Throttle(delay)),
+                        by_mx.items()):
+                    smtp_results.update(batch)
+            
+            def validate_one(email: str) -> Dict[str, any]:
+                smtp_result = smtp_results.get(email)
+                if smtp_result is None:
+                    throttles[email.rpartition('@')[2]].wait()
+                return self.validate_email(email, smtp_result)
+            
+            return list(executor.map(validate_one, normalized))
@@ -1,14 +1,84 @@
+import heapq
 import os
-import sys
+import re
+import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Optional
 from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Email, To, Content, Personalization
+from sendgrid.helpers.mail import Mail, Email, To, Content
 import json
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from utils import Throttle
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
+
+# {{key}} placeholders in campaign templates; whitespace inside the braces is tolerated
+PLACEHOLDER_RE = re.compile(r"\{\{\s*([^{}]+?)\s*\}\}")
+
+
+@lru_cache(maxsize=64)
+def _tokenize(template: str) -> tuple:
+    """
+    Split a template into text parts and placeholder slots once per distinct template.
+    
+    Literal text between placeholders is kept as single fused runs, so a render
+    only visits the slots. Placeholders keep their original text so they can be
+    left in place when a recipient has no value for them.
+    
+    Returns:
+        tuple: (parts, slots) where slots holds (index into parts, key) pairs
+    """
+    parts = []
+    slots = []
+    pos = 0
+    for match in PLACEHOLDER_RE.finditer(template):
+        if match.start() > pos:
+            parts.append(template[pos:match.start()])
+        slots.append((len(parts), match.group(1)))
+        parts.append(match.group(0))
+        pos = match.end()
+    if pos < len(template):
+        parts.append(template[pos:])
+    return tuple(parts), tuple(slots)
+
+@lru_cache(maxsize=64)
+def _message_skeleton(from_email: str, subject: str, text_content: Optional[str],
+                      html_content: Optional[str]) -> Dict:
+    """
+    Build the /mail/send body shared by every batch of a campaign, minus recipients.
+    
+    Cached per (sender, subject, content), so the Mail and Content helpers run
+    once per campaign; callers must copy the dict before adding personalizations.
+    """
+    message = Mail(from_email=Email(from_email), subject=subject)
+    if html_content:
+        message.content = Content("text/html", html_content)
+    else:
+        message.content = Content("text/plain", text_content)
+    return message.get()
+
+def to_json_bytes(data: Dict, pretty: bool = False) -> bytes:
+    """
+    Serialize campaign results or a /mail/send body to UTF-8 JSON.
+    
+    Uses orjson when it is installed and falls back to the stdlib encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, indent=2 if pretty else None).encode('utf-8')
 
 # Reference: python_sendgrid integration
 class EmailCampaignManager:
+    # SendGrid accepts at most this many personalizations per /mail/send request
+    MAX_PERSONALIZATIONS = 1000
+    
     def __init__(self):
         """Initialize the SendGrid email campaign manager."""
         self.api_key = os.environ.get('SENDGRID_API_KEY')
@@ -18,6 +88,51 @@ class EmailCampaignManager:
         self.sg = SendGridAPIClient(self.api_key)
         self.logger = logging.getLogger(__name__)
         
+        # Keep-alive session for batch sends, so parallel batches reuse warm TLS connections
+        self.http = requests.Session()
+        self.http.headers.update({
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        })
+        self.http.mount('https://', HTTPAdapter(pool_maxsize=16))
+        self.mail_send_url = f"{self.sg.host}/v3/mail/send"
+        
+        # Epoch seconds until which SendGrid reported the rate limit as exhausted
+        self._rate_limit_reset = 0.0
+        self._rate_limit_lock = threading.Lock()
+    
+    def _wait_for_rate_limit(self):
+        """Sleep only while SendGrid's last reported rate-limit window is exhausted."""
+        with self._rate_limit_lock:
+            reset = self._rate_limit_reset
+        
+        delay = reset - time.time()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _record_rate_limit(self, headers) -> bool:
+        """
+        Note the X-RateLimit-* headers of a response.
+        
+        Returns:
+            bool: True if the limit is exhausted until a reset time
+        """
+        if not headers:
+            return False
+        
+        try:
+            remaining = int(headers.get('X-RateLimit-Remaining'))
+            reset = float(headers.get('X-RateLimit-Reset'))
+        except (TypeError, ValueError):
+            return False
+        
+        if remaining > 0:
+            return False
+        
+        with self._rate_limit_lock:
+            self._rate_limit_reset = max(self._rate_limit_reset, reset)
+        return True
+        
     def send_single_email(
         self,
         to_email: str,
@@ -70,6 +185,63 @@ class EmailCampaignManager:
                 "to": to_email
             }
     
+    def send_batch(
+        self,
+        recipients: List[str],
+        from_email: str,
+        subject: str,
+        text_content: str = None,
+        html_content: str = None
+    ) -> Dict:
+        """
+        Send one message to many recipients in a single SendGrid request.
+        
+        Each recipient gets their own personalization, so nobody sees the
+        other addresses. Requests go through a pooled keep-alive session.
+        
+        Args:
+            recipients: Up to MAX_PERSONALIZATIONS recipient email addresses
+            from_email: Sender email address
+            subject: Email subject
+            text_content: Plain text content
+            html_content: HTML content
+            
+        Returns:
+            Dict with status and message for the whole batch
+        """
+        try:
+            if not html_content and not text_content:
+                return {"success": False, "error": "No email content provided", "to": recipients}
+            
+            message = dict(_message_skeleton(from_email, subject, text_content, html_content))
+            message["personalizations"] = [{"to": [{"email": recipient}]} for recipient in recipients]
+            
+            body = to_json_bytes(message)
+            
+            self._wait_for_rate_limit()
+            response = self.http.post(self.mail_send_url, data=body, timeout=30)
+            if self._record_rate_limit(response.headers) and response.status_code == 429:
+                # A 429 carries the reset time; wait it out once and retry
+                self._wait_for_rate_limit()
+                response = self.http.post(self.mail_send_url, data=body, timeout=30)
+                self._record_rate_limit(response.headers)
+            response.raise_for_status()
+            
+            return {
+                "success": True,
+                "status_code": response.status_code,
+                "message": f"Email sent to {len(recipients)} recipients",
+                "to": recipients
+            }
+            
+        except Exception as e:
+            self.logger.error(f"SendGrid error sending batch of {len(recipients)}: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "to": recipients
+            }
+    
     def send_bulk_campaign(
         self,
         recipients: List[str],
@@ -77,7 +249,8 @@ class EmailCampaignManager:
         subject: str,
         text_content: str = None,
         html_content: str = None,
-        delay_seconds: int = 1
+        delay_seconds: float = 0,
+        max_workers: int = 4
     ) -> Dict:
         """
         Send a bulk email campaign to multiple recipients.
@@ -88,7 +261,9 @@ class EmailCampaignManager:
             subject: Email subject
             text_content: Plain text content
             html_content: HTML content
-            delay_seconds: Delay between emails to respect rate limits
+            delay_seconds: Optional fixed spacing between batch requests; SendGrid's
+                rate-limit headers are always honoured
+            max_workers: Number of batch requests allowed in flight at once
             
         Returns:
             Dict with campaign results
@@ -101,28 +276,34 @@ class EmailCampaignManager:
             "campaign_id": f"campaign_{int(time.time())}"
         }
         
-        for i, recipient in enumerate(recipients):
-            result = self.send_single_email(
-                to_email=recipient,
+        # One request per MAX_PERSONALIZATIONS recipients instead of one per recipient
+        batches = [recipients[i:i + self.MAX_PERSONALIZATIONS]
+                   for i in range(0, len(recipients), self.MAX_PERSONALIZATIONS)]
+        
+        # Batches overlap on the network; send_batch pauses only when SendGrid says so
+        throttle = Throttle(delay_seconds)
+        
+        def send_one(batch: List[str]) -> Dict:
+            throttle.wait()
+            return self.send_batch(
+                recipients=batch,
                 from_email=from_email,
                 subject=subject,
                 text_content=text_content,
                 html_content=html_content
             )
-            
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            sent = list(executor.map(send_one, batches))
+        
+        for batch, result in zip(batches, sent):
             if result["success"]:
-                results["total_sent"] += 1
-                results["successful_sends"].append(recipient)
+                results["total_sent"] += len(batch)
+                results["successful_sends"].extend(batch)
             else:
-                results["total_failed"] += 1
-                results["failed_sends"].append({
-                    "email": recipient,
-                    "error": result.get("error", "Unknown error")
-                })
-            
-            # Rate limiting - don't overwhelm SendGrid
-            if i < len(recipients) - 1:
-                time.sleep(delay_seconds)
+                error = result.get("error", "Unknown error")
+                results["total_failed"] += len(batch)
+                results["failed_sends"].extend({"email": recipient, "error": error} for recipient in batch)
         
         return results
     
@@ -141,6 +322,9 @@ class EmailCampaignManager:
         """
         Replace placeholders in email template with personalized data.
         
+        The template is tokenized once and reused across recipients; placeholders
+        without a value are left as-is.
+        
         Args:
             template: Email template with placeholders like {{name}}, {{company}}
             recipient_data: Dict with replacement values
@@ -148,12 +332,14 @@ class EmailCampaignManager:
         Returns:
             Personalized email content
         """
-        personalized = template
-        for key, value in recipient_data.items():
-            placeholder = f"{{{{{key}}}}}"
-            personalized = personalized.replace(placeholder, value)
+        template_parts, slots = _tokenize(template)
+        parts = list(template_parts)
+        for index, key in slots:
+            value = recipient_data.get(key)
+            if value is not None:
+                parts[index] = str(value)
         
-        return personalized
+        return "".join(parts)
 
 class AutoReplyManager:
     """Manage automatic email replies and follow-ups."""
@@ -162,6 +348,8 @@ class AutoReplyManager:
         self.campaign_manager = campaign_manager
         self.auto_replies = {}
         self.followup_schedules = {}
+        # (scheduled_for, followup_id) min-heap, so due follow-ups are found without a full scan
+        self._followup_queue = []
     
     def setup_auto_reply(self, campaign_id: str, reply_template: str, delay_hours: int = 24):
         """Set up automatic reply for a campaign."""
@@ -192,6 +380,7 @@ class AutoReplyManager:
         }
         
         self.followup_schedules[followup_id] = followup_data
+        heapq.heappush(self._followup_queue, (followup_data["scheduled_for"], followup_id))
         return followup_id
     
     def send_scheduled_followups(self):
@@ -199,9 +388,10 @@ class AutoReplyManager:
         current_time = time.time()
         sent_followups = []
         
-        for followup_id, followup_data in self.followup_schedules.items():
-            if (followup_data["status"] == "scheduled" and 
-                current_time >= followup_data["scheduled_for"]):
+        while self._followup_queue and self._followup_queue[0][0] <= current_time:
+            _, followup_id = heapq.heappop(self._followup_queue)
+            followup_data = self.followup_schedules.get(followup_id)
+            if followup_data and followup_data["status"] == "scheduled":
                 
                 # Send the follow-up campaign
                 results = self.campaign_manager.send_bulk_campaign(